@@ -16,18 +16,18 @@ Note:
 
 from __future__ import annotations
 
+import bisect
 import dataclasses
-import re
 import typing
 
 if typing.TYPE_CHECKING:
     import pathlib
 
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Sequence
 
     from .rule import Rule
 
-from . import error, settings
+from . import error, registry, settings
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -48,17 +48,54 @@ class Span:
     start: int
     end: int
 
+
+class Spans:
+    """Sorted index over ignored line spans of a single rule.
+
+    Note:
+        Spans are kept as two parallel, sorted lists of span
+        boundaries, hence membership checks cost O(log n)
+        (via `bisect`) instead of a linear scan over `Span`
+        objects.
+
+    """
+
+    __slots__: tuple[str, ...] = ("_ends", "_starts")
+
+    def __init__(self, spans: Iterable[Span]) -> None:
+        """Initialize the index from `spans`.
+
+        Args:
+            spans:
+                Spans to index (in any order).
+
+        """
+        ordered = sorted(spans, key=lambda span: span.start)
+        self._starts: list[int] = [span.start for span in ordered]
+        self._ends: list[int] = [span.end for span in ordered]
+
     def __contains__(self, line: int) -> bool:
-        """Whether a given line is within the `span`.
+        """Whether a given line is within any indexed span.
 
         Args:
             line:
-                Line number to verify
+                Line number to verify.
 
         Returns:
-            `True` if `line` is within the `span`, `False` otherwise.
+            `True` if `line` is within any span, `False` otherwise.
+
         """
-        return self.start <= line <= self.end
+        index = bisect.bisect_right(self._starts, line) - 1
+        return index >= 0 and line <= self._ends[index]
+
+    def __len__(self) -> int:
+        """Number of indexed spans.
+
+        Returns:
+            Number of indexed spans.
+
+        """
+        return len(self._starts)
 
 
 def file(rule: Rule, content: str) -> bool:
@@ -75,54 +112,146 @@ def file(rule: Rule, content: str) -> bool:
         for a given rule, `False` otherwise.
 
     """
-    return (
-        re.search(
-            settings.ignore_file.format(name=settings.name, code=rule.code),
-            content,
-        )
-        is not None
+    regex = registry._compile_ignore(  # noqa: SLF001
+        settings.ignore_file.format(name=settings.name, code=rule.code)
     )
+    return regex.search(content) is not None
+
 
+def _candidates(lines: Sequence[str], content: str) -> list[tuple[int, str]]:
+    """Narrow `lines` to the ignore-span marker candidates.
 
-def spans(file: pathlib.Path, rule: Rule, lines: list[str]) -> Iterator[Span]:
-    # ~ O(r*l) time complexity :/
-    """Get spans of lines that are ignored for a given rule.
+    Note:
+        Any-code markers (e.g. ` noqa-start: <NAME>` without the
+        code) are matched in a single `finditer` sweep over the
+        whole buffer (line numbers are recovered by counting
+        newlines up to each match); `.` does not cross newlines,
+        hence whole-buffer matches are equivalent to per-line
+        searches.
 
     Warning:
-        Raises `error` if the `span` is not closed properly.
+        When either span template invalidates the any-code render
+        (see `registry._supports_any_code`), no narrowing happens
+        and every line is a candidate.
+
+    Args:
+        lines:
+            Lines of the file to narrow.
+        content:
+            Raw (unsplit) content of the file.
+
+    Returns:
+        `(line number, line)` pairs of the candidate lines.
+
+    """
+    if not (
+        registry._supports_any_code(settings.ignore_span_start)  # noqa: SLF001
+        and registry._supports_any_code(settings.ignore_span_end)  # noqa: SLF001
+    ):
+        return list(enumerate(lines))
+    any_start = registry._compile_ignore(  # noqa: SLF001
+        settings.ignore_span_start.format(name=settings.name, code="")
+    )
+    any_end = registry._compile_ignore(  # noqa: SLF001
+        settings.ignore_span_end.format(name=settings.name, code="")
+    )
+    numbers = sorted(
+        {
+            content.count("\n", 0, match.start())
+            for regex in (any_start, any_end)
+            for match in regex.finditer(content)
+        }
+    )
+    return [(i, lines[i]) for i in numbers]
+
+
+def parse_file(
+    file: pathlib.Path,
+    rules: Iterable[Rule],
+    lines: Sequence[str],
+    content: str,
+) -> dict[int | None, Spans]:
+    """Get ignored spans for every rule in a single pass over `content`.
+
+    Note:
+        Lines are first narrowed to the (usually few) candidates
+        matching the span markers with __any__ code, hence the
+        per-rule scans only touch marker lines instead of being
+        ~O(rules * lines).
+
+    Warning:
+        Raises `error` if a `span` is not closed properly.
         If it's `closed` but not opened, the span will be ignored.
 
+    Args:
+        file:
+            Path to the file for which spans are calculated.
+        rules:
+            Rules to check against.
+        lines:
+            Lines of the file to check.
+        content:
+            Raw (unsplit) content of the file.
+
+    Raises:
+        error.IgnoreRangeError:
+            If there is an unclosed ignore range (has `start`, but no `end).
+
+    Returns:
+        Mapping of rule code to its (indexed) ignored spans.
+
+    """
+    candidates = _candidates(lines, content)
+    return {
+        rule.code: Spans(_rule_spans(file, rule, candidates, lines))
+        for rule in rules
+    }
+
+
+def _rule_spans(
+    file: pathlib.Path,
+    rule: Rule,
+    candidates: list[tuple[int, str]],
+    lines: Sequence[str],
+) -> list[Span]:
+    """Scan the `candidates` for the spans of a single rule.
+
     Args:
         file:
             Path to the file for which spans are calculated.
         rule:
-            Rule to check against
+            Rule to check against.
+        candidates:
+            `(line number, line)` pairs possibly carrying markers.
         lines:
-            Lines of the file to check
+            Lines of the file to check.
 
     Raises:
         error.IgnoreRangeError:
             If there is an unclosed ignore range (has `start`, but no `end).
 
-    Yields:
-        Spans of lines that are ignored for a given rule.
+    Returns:
+        Spans of lines ignored for `rule`.
 
     """
-    start_regex = re.compile(
+    start_regex = registry._compile_ignore(  # noqa: SLF001
         settings.ignore_span_start.format(name=settings.name, code=rule.code)
     )
-    end_regex = re.compile(
+    end_regex = registry._compile_ignore(  # noqa: SLF001
         settings.ignore_span_end.format(name=settings.name, code=rule.code)
     )
 
+    rule_spans: list[Span] = []
     start = None
-    for i, line in enumerate(lines):
+    for i, line in candidates:
         if start is None:
             if start_regex.search(line) is not None:
                 start = i
         elif end_regex.search(line) is not None:
-            yield Span(start=start, end=i)
+            rule_spans.append(Span(start=start, end=i))
             start = None
 
     if start is not None:
         raise error.IgnoreRangeError(file, start, line=lines[start])
+
+    return rule_spans
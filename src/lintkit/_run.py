@@ -7,27 +7,193 @@
 
 from __future__ import annotations
 
+import collections
+import collections.abc
+import concurrent.futures
+import itertools
+import os
 import pathlib
+import threading
 import typing
 import warnings
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+    from collections.abc import Iterable, Iterator, Sequence
 
 
-from . import _ignore, registry
+from . import _ignore, available, error, registry
 from . import rule as r
 
 
+class _LazyLines(collections.abc.Sequence[str]):
+    r"""Line view over file content, split on first access.
+
+    Note:
+        Files skipped by every rule never touch their lines,
+        hence splitting eagerly in `_read` wasted a full copy
+        of the content for them. The split result is cached
+        after the first access.
+
+    Warning:
+        Content is split on `"\\n"` __only__ (not `splitlines`,
+        which also splits on form feeds et al.), hence indexing
+        stays consistent with `ast` line numbers and the
+        newline-counting span scan in `_ignore.parse_file`.
+
+    """
+
+    __slots__: tuple[str, ...] = ("_content", "_lines")
+
+    def __init__(self, content: str) -> None:
+        """Initialize the view over `content`.
+
+        Args:
+            content:
+                Raw file content to (eventually) split.
+
+        """
+        super().__init__()
+        self._content: str = content
+        self._lines: list[str] | None = None
+
+    def _materialized(self) -> list[str]:
+        """Split the content (once) and return the lines.
+
+        Returns:
+            Content split by newlines.
+
+        """
+        if self._lines is None:
+            self._lines = self._content.split("\n")
+        return self._lines
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:  # pyright: ignore[reportImplicitOverride]
+        """Get line(s) under `index`.
+
+        Args:
+            index:
+                Index (or slice) of the line(s).
+
+        Returns:
+            Line(s) under `index`.
+
+        """
+        return self._materialized()[index]
+
+    def __len__(self) -> int:  # pyright: ignore[reportImplicitOverride]
+        """Number of lines in the content.
+
+        Returns:
+            Number of lines.
+
+        """
+        return len(self._materialized())
+
+    def __iter__(self) -> Iterator[str]:  # pyright: ignore[reportImplicitOverride]
+        """Iterate over the lines.
+
+        Returns:
+            Iterator over the lines.
+
+        """
+        return iter(self._materialized())
+
+
+_worker_rules: list[r.Rule] | None = None
+"""Rules unpickled once per worker process, used by `_lint_one`."""
+
+_worker_file_codes: frozenset[int | None] = frozenset()
+"""Codes of `rule.File` rules, precomputed once per worker process."""
+
+_worker_all_rules: list[r.All] = []
+"""`rule.All` rules of the worker, precomputed once per worker process."""
+
+_worker_warn: bool = False
+"""`warn` flag forwarded to worker processes, used by `_lint_one`."""
+
+_PREFETCH: int = 4
+"""Number of file reads kept in flight ahead of rule execution."""
+
+_READ_CACHE_SIZE: int = 128
+"""Maximum number of file contents kept in `_read_cache`."""
+
+_read_cache: collections.OrderedDict[
+    pathlib.Path, tuple[tuple[int, int], tuple[Sequence[str], str]]
+] = collections.OrderedDict()
+"""LRU cache of loaded files, validated via `(st_mtime_ns, st_size)`.
+
+Note:
+    Repeated runs over the same (unchanged) files skip the
+    `read`/`decode` entirely; together with the content-keyed
+    parser memoization in [`lintkit.loader`][] this makes
+    re-linting an unchanged file an almost pure cache replay.
+"""
+
+_read_cache_lock = threading.Lock()
+"""Guards `_read_cache`: `_read` runs on the prefetcher's threads."""
+
+
+def _bucket_rules(
+    rules: list[r.Rule],
+) -> tuple[frozenset[int | None], list[r.All]]:
+    """Bucket `rules` by their concrete rule type.
+
+    Note:
+        `isinstance` checks against the (ABC-backed) rule types are
+        surprisingly costly in per-file loops, hence they are done
+        once per run and consulted via code/bucket membership later.
+
+    Args:
+        rules:
+            Rules to bucket.
+
+    Returns:
+        Codes of [`lintkit.rule.File`][] rules and the list of
+            [`lintkit.rule.All`][] rules.
+
+    """
+    file_codes = frozenset(
+        rule.code for rule in rules if isinstance(rule, r.File)
+    )
+    all_rules = [rule for rule in rules if isinstance(rule, r.All)]
+    return file_codes, all_rules
+
+
+def _as_path(file: pathlib.Path | str | os.PathLike[str]) -> pathlib.Path:
+    """Coerce `file` to a `pathlib.Path` without re-wrapping.
+
+    Note:
+        Callers usually already pass `pathlib.Path` objects;
+        re-parsing them in the hot per-file loop is wasted work.
+
+    Note:
+        Any `os.PathLike` (e.g. `os.DirEntry` yielded by
+        `os.scandir`) is accepted, hence directories can be
+        streamed into [`lintkit.run`][] without materializing
+        a `glob` list up-front.
+
+    Args:
+        file: File path to coerce.
+
+    Returns:
+        `file` itself if it is already a `pathlib.Path`,
+            a freshly constructed one otherwise.
+    """
+    if isinstance(file, pathlib.Path):
+        return file
+    return pathlib.Path(os.fspath(file))
+
+
 # Changing to overload: https://typing.python.org/en/latest/spec/overload.html
 # does not help basedpyright unfortunately
 def run(  # noqa: PLR0913
-    files: Iterable[pathlib.Path | str],
+    files: Iterable[pathlib.Path | str | os.PathLike[str]],
     include_codes: Iterable[int] | None = None,
     exclude_codes: Iterable[int] | None = None,
     end_mode: typing.Literal["first", "all"] = "all",
     output: bool = False,  # noqa: FBT001, FBT002
     warn: bool = False,  # noqa: FBT001, FBT002
+    jobs: int = 1,
 ) -> Iterator[tuple[bool, r.Rule]] | bool:
     """Run all the rules on a given file.
 
@@ -99,6 +265,12 @@ def run(  # noqa: PLR0913
             If `True`, warn about UnicodeDecodeError when encountering
             files `lintkit` is unable to read. Default: `False`
             (skips the file silently).
+        jobs:
+            Number of worker processes used to lint files in parallel.
+            `1` (the default) runs everything sequentially, `0` uses
+            all available CPUs. Parallelism is only used when there
+            are at least two files and `end_mode="all"` (the `"first"`
+            short-circuit is inherently sequential).
 
     Returns:
         An iterator over all rules and their outputs OR a boolean indicating
@@ -110,6 +282,7 @@ def run(  # noqa: PLR0913
         exclude_codes=exclude_codes,
         end_mode=end_mode,
         warn=warn,
+        jobs=jobs,
     )
     if output:
         return generator_or_callable
@@ -117,12 +290,13 @@ def run(  # noqa: PLR0913
     return any(result[0] for result in generator_or_callable)
 
 
-def _run(  # noqa: C901, PLR0912
-    files: Iterable[pathlib.Path | str],
+def _run(  # noqa: C901, PLR0912, PLR0913
+    files: Iterable[pathlib.Path | str | os.PathLike[str]],
     include_codes: Iterable[int] | None = None,
     exclude_codes: Iterable[int] | None = None,
     end_mode: typing.Literal["first", "all"] = "all",
     warn: bool = False,  # noqa: FBT001, FBT002
+    jobs: int = 1,
 ) -> Iterator[tuple[bool, r.Rule]]:
     """Internal function to run the rules on files.
 
@@ -146,60 +320,417 @@ def _run(  # noqa: C901, PLR0912
             If `True`, warn about UnicodeDecodeError when encountering
             files `lintkit` is unable to read. Default: `False`
             (skips the file silently).
+        jobs:
+            Number of worker processes used to lint files in parallel.
+            `1` runs sequentially, `0` uses all available CPUs.
 
     Yields:
         Rule and whether it raised an error.
     """
     rules = list(
-        registry.query(include_codes=include_codes, exclude_codes=exclude_codes)
+        registry._cached_query(  # noqa: SLF001
+            None if include_codes is None else frozenset(include_codes),
+            None if exclude_codes is None else frozenset(exclude_codes),
+        )
     )
 
-    for file in files:
-        path = pathlib.Path(file)
-
-        output = _load(path, warn)
-        if output is None:
-            continue
-
-        lines, content = output
-
-        # Setup and load necessary data for each rule
-        for rule in rules:
-            # Rule will have `skip` as it inherits from both Loader and Rule
-            if rule.skip(path, content) or _ignore.file(rule, content):  # pyright: ignore[reportAttributeAccessIssue]
-                continue
-            # Rule will have `_run_load` due to above
-            rule._run_load(  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
-                path,
-                content,
-                lines,
-                ignore_spans=list(_ignore.spans(path, rule, lines)),
-            )
-            for fail in rule():
-                yield fail, rule
-                if fail and end_mode == "first":
-                    return
-            if isinstance(rule, r.File):
-                fail = rule._run_finalize()  # noqa: SLF001
-                yield fail, rule
-                if fail and end_mode == "first":
-                    return
+    file_codes, all_rules = _bucket_rules(rules)
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    if jobs != 1 and end_mode != "first":
+        files = list(files)
+        # Spawning workers for a single file only adds overhead
+        if len(files) > 1:
+            yield from _run_parallel(files, rules, jobs=jobs, warn=warn)
+            return
+
+    prefetcher = (
+        _prefetched_iouring  # pragma: no cover
+        if available.LIBURING
+        else _prefetched
+    )
+    eager = end_mode != "first"
+    for path, output in prefetcher(files, warn=warn):
+        for fail, rule in _lint_file(
+            path, rules, file_codes, output, eager=eager
+        ):
+            yield fail, rule
+            if fail and end_mode == "first":
+                return
 
     for rule in rules:
         # Rule will have `_run_load` as it inherits from both Loader and Rule
         rule._run_reset()  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
 
-    for rule in (rule for rule in rules if isinstance(rule, r.All)):
+    for rule in all_rules:
         fail = rule._run_finalize()  # noqa: SLF001
         yield fail, rule
         if fail and end_mode == "first":
             return  # pragma: no cover
 
 
+def _prefetched(
+    files: Iterable[pathlib.Path | str | os.PathLike[str]],
+    warn: bool,  # noqa: FBT001
+) -> Iterator[tuple[pathlib.Path, tuple[Sequence[str], str] | None]]:
+    """Yield loaded files while reading the next ones in background.
+
+    Note:
+        File reads are independent and rule execution is CPU-bound,
+        hence keeping a few reads in flight (`_PREFETCH`) hides
+        the I/O latency of the next file behind the rules running
+        on the current one.
+
+    Args:
+        files:
+            Files to read.
+        warn:
+            If `True`, warn about UnicodeDecodeError when encountering
+            files `lintkit` is unable to read.
+
+    Yields:
+        File path and its loaded content (`None` if unreadable).
+    """
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=_PREFETCH
+    ) as executor:
+        iterator = iter(files)
+        pending: collections.deque[
+            tuple[
+                pathlib.Path,
+                concurrent.futures.Future[tuple[Sequence[str], str] | None],
+            ]
+        ] = collections.deque()
+        for file in itertools.islice(iterator, _PREFETCH):
+            path = _as_path(file)
+            pending.append((path, executor.submit(_load, path, warn)))
+
+        while pending:
+            path, future = pending.popleft()
+            # Keep the read pipeline full before blocking on `result`
+            for file in itertools.islice(iterator, 1):
+                next_path = _as_path(file)
+                pending.append(
+                    (next_path, executor.submit(_load, next_path, warn))
+                )
+            yield path, future.result()
+
+
+if available.LIBURING:  # pragma: no cover
+    import liburing  # pyright: ignore[reportMissingImports]
+
+    _IOURING_BATCH: int = 128
+    """Maximum reads submitted per `io_uring` batch (rlimit safety cap)."""
+
+    def _prefetched_iouring(
+        files: Iterable[pathlib.Path | str | os.PathLike[str]],
+        warn: bool,  # noqa: FBT001
+    ) -> Iterator[tuple[pathlib.Path, tuple[Sequence[str], str] | None]]:
+        """Yield loaded files read in `io_uring` batches.
+
+        Note:
+            All reads of a batch are submitted with a single syscall
+            which amortizes the per-file `open`/`read` overhead
+            (most noticeable for many small config files).
+
+        Args:
+            files:
+                Files to read.
+            warn:
+                If `True`, warn about UnicodeDecodeError when encountering
+                files `lintkit` is unable to read.
+
+        Yields:
+            File path and its loaded content (`None` if unreadable).
+        """
+        iterator = iter(files)
+        while batch := [
+            _as_path(file)
+            for file in itertools.islice(iterator, _IOURING_BATCH)
+        ]:
+            yield from zip(batch, _read_batch_iouring(batch, warn), strict=True)
+
+    def _read_batch_iouring(  # noqa: PLR0915
+        paths: list[pathlib.Path],
+        warn: bool,  # noqa: FBT001
+    ) -> list[tuple[Sequence[str], str] | None]:
+        """Read `paths` as a single `io_uring` submission batch.
+
+        Note:
+            Completion results (`cqe.res`) are checked per read;
+            failed or short reads fall back to the regular `_load`
+            path instead of linting a NUL-padded/truncated buffer.
+
+        Args:
+            paths:
+                Files to read (at most `_IOURING_BATCH`).
+            warn:
+                If `True`, warn about UnicodeDecodeError when
+                encountering files `lintkit` is unable to read.
+
+        Returns:
+            Loaded content per path (`None` where decoding failed).
+        """
+        ring = liburing.io_uring()
+        liburing.io_uring_queue_init(len(paths), ring, 0)
+        descriptors: list[int] = []
+        buffers: list[bytearray] = []
+        # Bytes actually read per submission (mapped via `user_data`)
+        read_sizes = [-1] * len(paths)
+        try:
+            for index, path in enumerate(paths):
+                descriptor = os.open(path, os.O_RDONLY)
+                descriptors.append(descriptor)
+                buffers.append(bytearray(os.fstat(descriptor).st_size))
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_read(
+                    sqe, descriptor, buffers[index], len(buffers[index]), 0
+                )
+                sqe.user_data = index
+
+            liburing.io_uring_submit(ring)
+
+            cqe = liburing.io_uring_cqe()
+            for _ in paths:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                read_sizes[cqe.user_data] = cqe.res
+                liburing.io_uring_cqe_seen(ring, cqe)
+        finally:
+            for descriptor in descriptors:
+                os.close(descriptor)
+            liburing.io_uring_queue_exit(ring)
+
+        return [
+            _decode_buffer(path, buffer, warn=warn)
+            if size == len(buffer)
+            else _load(path, warn)
+            for path, buffer, size in zip(
+                paths, buffers, read_sizes, strict=True
+            )
+        ]
+
+    def _decode_buffer(
+        path: pathlib.Path,
+        buffer: bytearray,
+        warn: bool,  # noqa: FBT001
+    ) -> tuple[Sequence[str], str] | None:
+        """Decode a fully read `io_uring` buffer.
+
+        Args:
+            path:
+                File the buffer was read from (used for warnings).
+            buffer:
+                Raw file content (fully read).
+            warn:
+                If `True`, warn about UnicodeDecodeError when
+                encountering files `lintkit` is unable to read.
+
+        Returns:
+            Loaded content (`None` where decoding failed).
+        """
+        try:
+            # Same universal-newline translation as `_read`, hence
+            # batched and regular reads produce identical lines/content
+            content = _normalize_newlines(bytes(buffer).decode())
+        except UnicodeDecodeError:
+            if warn:
+                warnings.warn(
+                    f"File '{path}' could not be loaded.",
+                    category=UnicodeWarning,
+                    stacklevel=4,
+                )
+            return None
+        return _LazyLines(content), content
+
+else:  # pragma: no cover
+    pass
+
+
+def _lint_file(
+    path: pathlib.Path,
+    rules: list[r.Rule],
+    file_codes: frozenset[int | None],
+    output: tuple[Sequence[str], str] | None,
+    eager: bool = True,  # noqa: FBT001, FBT002
+) -> Iterator[tuple[bool, r.Rule]]:
+    """Run all `rules` on a single file.
+
+    Note:
+        [`lintkit.rule.All`][] rules only accumulate their failures
+        here, their finalization happens in `_run` (or is merged
+        by the parent process when running in parallel).
+
+    Args:
+        path:
+            File to lint.
+        rules:
+            Rules to run on the file.
+        file_codes:
+            Codes of [`lintkit.rule.File`][] rules
+            (precomputed via `_bucket_rules`).
+        output:
+            Loaded file content as returned by `_load`
+            (`None` if the file could not be read).
+        eager:
+            If `True`, run each rule through its (tighter)
+            `_call_list` loop; `False` keeps the lazy generator
+            (required by `end_mode="first"` short-circuiting).
+
+    Yields:
+        Rule and whether it raised an error.
+    """
+    if output is None:
+        return
+
+    lines, content = output
+
+    # Filter applicable rules up-front; files no rule applies to
+    # (common for format-specific rules) never load anything
+    applicable = [
+        rule
+        for rule in rules
+        # Rule will have `skip` as it inherits from both Loader and Rule
+        if not rule.skip(path, content)  # pyright: ignore[reportAttributeAccessIssue]
+        and not _ignore.file(rule, content)
+    ]
+
+    # Single pass over the lines shared by all applicable rules
+    all_spans = _ignore.parse_file(path, applicable, lines, content)
+
+    # Setup and load necessary data for each rule
+    for rule in applicable:
+        # Rule will have `_run_load` due to above
+        rule._run_load(  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
+            path,
+            content,
+            lines,
+            ignore_spans=all_spans[rule.code],
+        )
+        for fail in rule._call_list() if eager else rule():  # noqa: SLF001
+            yield fail, rule
+        if rule.code in file_codes:
+            yield rule._run_finalize(), rule  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def _initialize_worker(
+    rules: list[r.Rule],
+    warn: bool,  # noqa: FBT001
+) -> None:  # pragma: no cover
+    """Initialize a worker process with unpickled `rules`.
+
+    Note:
+        Rules are transferred once per worker (instead of once
+        per file) which keeps the serialization overhead constant.
+
+    Args:
+        rules:
+            Rules to run within this worker.
+        warn:
+            If `True`, warn about UnicodeDecodeError when encountering
+            files `lintkit` is unable to read.
+
+    """
+    global _worker_rules, _worker_file_codes, _worker_all_rules, _worker_warn  # noqa: PLW0603
+    _worker_rules = rules
+    _worker_file_codes, _worker_all_rules = _bucket_rules(rules)
+    _worker_warn = warn
+
+
+def _lint_one(
+    file: pathlib.Path | str | os.PathLike[str],
+) -> tuple[list[tuple[bool, int]], dict[int, int]]:  # pragma: no cover
+    """Lint a single file within a worker process.
+
+    Note:
+        Rules are not pickled back to the parent; results reference
+        rules by their (unique) `code` instead.
+
+    Args:
+        file:
+            File to lint.
+
+    Returns:
+        Per-value results as `(fail, code)` pairs and accumulated
+            [`lintkit.rule.All`][] failure counts (to be merged
+            by the parent before finalization).
+    """
+    if _worker_rules is None:
+        raise error.LintkitInternalError
+
+    path = _as_path(file)
+    results = [
+        (fail, rule.code)
+        for fail, rule in _lint_file(
+            path, _worker_rules, _worker_file_codes, _load(path, _worker_warn)
+        )
+    ]
+    deltas: dict[int, int] = {}
+    for rule in _worker_all_rules:
+        if rule.n_fails:
+            deltas[rule.code] = rule.n_fails  # pyright: ignore[reportArgumentType]
+            # Reset so the next file reports an independent delta
+            rule.n_fails = 0
+    return results, deltas  # pyright: ignore[reportReturnType]
+
+
+def _run_parallel(
+    files: list[pathlib.Path | str | os.PathLike[str]],
+    rules: list[r.Rule],
+    jobs: int,
+    warn: bool,  # noqa: FBT001
+) -> Iterator[tuple[bool, r.Rule]]:
+    """Lint `files` using a pool of `jobs` worker processes.
+
+    Note:
+        Per-file work ([`lintkit.rule.Node`][] and
+        [`lintkit.rule.File`][] rules) is fully parallel;
+        [`lintkit.rule.All`][] rules accumulate their failures
+        in the workers and are merged and finalized here.
+
+    Args:
+        files:
+            Files to lint.
+        rules:
+            Rules to run on the files.
+        jobs:
+            Number of worker processes.
+        warn:
+            If `True`, warn about UnicodeDecodeError when encountering
+            files `lintkit` is unable to read.
+
+    Yields:
+        Rule and whether it raised an error.
+    """
+    by_code = {rule.code: rule for rule in rules}
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_initialize_worker,
+        initargs=(rules, warn),
+    ) as executor:
+        for results, deltas in executor.map(
+            _lint_one,
+            files,
+            chunksize=max(1, len(files) // (jobs * 4)),
+        ):
+            for fail, code in results:
+                yield fail, by_code[code]
+            for code, n_fails in deltas.items():
+                by_code[code].n_fails += n_fails  # pyright: ignore[reportAttributeAccessIssue]
+
+    for rule in rules:
+        # Rule will have `_run_reset` as it inherits from both Loader and Rule
+        rule._run_reset()  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
+
+    for rule in _bucket_rules(rules)[1]:
+        yield rule._run_finalize(), rule  # noqa: SLF001
+
+
 def _load(
     path: pathlib.Path,
     warn: bool,  # noqa: FBT001
-) -> tuple[list[str], str] | None:
+) -> tuple[Sequence[str], str] | None:
     """Load contents in `path`.
 
     Args:
@@ -226,9 +757,38 @@ def _load(
         return None
 
 
-def _read(file: pathlib.Path) -> tuple[list[str], str]:
+def _normalize_newlines(content: str) -> str:
+    r"""Translate universal newlines to `"\n"`, like text-mode reads.
+
+    Note:
+        Contents are read in binary mode (see `_read`), hence `\r\n`
+        and bare `\r` line endings have to be translated manually to
+        keep lines, regexes and newline counting identical to the
+        text-mode behavior.
+
+    Args:
+        content:
+            Decoded file content.
+
+    Returns:
+        Content with `"\n"`-only line endings.
+
+    """
+    if "\r" in content:
+        return content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _read(file: pathlib.Path) -> tuple[Sequence[str], str]:
     """Setup the file for linting.
 
+    Note:
+        Contents are cached (LRU, `_READ_CACHE_SIZE` entries) and
+        validated by a single `stat` call, hence linting the same
+        unchanged file multiple times in one process (common for
+        editor integrations and repeated `run` calls) only reads
+        it once.
+
     Args:
         file: The file to be linted
 
@@ -237,6 +797,20 @@ def _read(file: pathlib.Path) -> tuple[list[str], str]:
             - The file path
             - File content line by line
     """
-    content = file.read_text()
-    lines = content.split("\n")
-    return lines, content
+    stamp = (stat := file.stat()).st_mtime_ns, stat.st_size
+    with _read_cache_lock:
+        cached = _read_cache.get(file)
+        if cached is not None and cached[0] == stamp:
+            _read_cache.move_to_end(file)
+            return cached[1]
+    # Binary read avoids the text-mode layer; decoding happens once
+    # over the whole contiguous buffer, with the universal-newline
+    # translation of `read_text` replicated below (CRLF files would
+    # otherwise leak `\r` into every line)
+    content = _normalize_newlines(file.read_bytes().decode())
+    output = _LazyLines(content), content
+    with _read_cache_lock:
+        _read_cache[file] = (stamp, output)
+        if len(_read_cache) > _READ_CACHE_SIZE:
+            _ = _read_cache.popitem(last=False)
+    return output
@@ -24,19 +24,20 @@ Example:
 from __future__ import annotations
 
 import dataclasses
+import operator
 import typing
 
-import wrapt
-
 from . import available
 
 if typing.TYPE_CHECKING:
     import ast
 
+    from collections.abc import Iterator
+
 T = typing.TypeVar("T")
 
 
-class Value(wrapt.ObjectProxy, typing.Generic[T]):  # pyright: ignore [reportUntypedBaseClass]
+class Value(typing.Generic[T]):
     """`Value` used by rules for verification.
 
     Note:
@@ -45,7 +46,8 @@ class Value(wrapt.ObjectProxy, typing.Generic[T]):  # pyright: ignore [reportUnt
 
     Tip:
         You should use objects of this class __just like you would
-        use the `value` directly.__ as it is a "perfect proxy".
+        use the `value` directly__ for the common operations (see
+        the `Note` below for the exact forwarded set).
         Its other functionalities __are used internally__ (e.g. `Pointer`)
 
     Can be essentially anything (e.g. `dict` from parsed `JSON`,
@@ -72,10 +74,17 @@ class Value(wrapt.ObjectProxy, typing.Generic[T]):  # pyright: ignore [reportUnt
         them within `values` function.
 
     Note:
-        This `class` acts as a "perfect proxy" for end users
-        by utilising [`wrapt`](https://github.com/GrahamDumpleton/wrapt)
-        (which means wrapped `value` should be usable just like
-        the original one).
+        This `class` acts as a proxy for end users: `__class__`,
+        attribute access and the common dunders forward to the
+        wrapped `value`, while a narrow `__slots__` layout keeps
+        it cheap to allocate on hot paths. The forwarded dunders
+        are: `repr`/`str`/`bool`/`hash`, equality and ordering
+        (`==`, `!=`, `<`, `<=`, `>`, `>=`), arithmetic (`+`, `-`,
+        `*`, `/`, `//`, `%`, `**`, unary `-`, `abs`), conversions
+        (`int`, `float`, `__index__`), iteration (`iter`/`next`),
+        containment, indexing and `len`. Reflected (`2 + value`)
+        and in-place (`value += 2`) operators are __not__
+        forwarded — unwrap via `value.__wrapped__` for those.
 
 
     Attributes:
@@ -99,6 +108,16 @@ class Value(wrapt.ObjectProxy, typing.Generic[T]):  # pyright: ignore [reportUnt
 
     """
 
+    __slots__: tuple[str, ...] = (
+        "__wrapped__",
+        "_self_comment",
+        "_self_end_column",
+        "_self_end_line",
+        "_self_metadata",
+        "_self_start_column",
+        "_self_start_line",
+    )
+
     def __init__(  # noqa: PLR0913
         self,
         value: T = None,
@@ -109,16 +128,18 @@ class Value(wrapt.ObjectProxy, typing.Generic[T]):  # pyright: ignore [reportUnt
         comment: str | None = None,
         **kwargs: typing.Any,
     ) -> None:
-        super().__init__(value)
+        self.__wrapped__: T = value
 
+        # Shareable as `Pointer` is frozen; saves four allocations
+        # per pointer-less `Value` (e.g. every `from_toml` item)
         if start_line is None:
-            start_line = Pointer()
+            start_line = _NULL_POINTER
         if start_column is None:
-            start_column = Pointer()
+            start_column = _NULL_POINTER
         if end_line is None:
-            end_line = Pointer()
+            end_line = _NULL_POINTER
         if end_column is None:
-            end_column = Pointer()
+            end_column = _NULL_POINTER
 
         self._self_start_line: Pointer = start_line
         self._self_start_column: Pointer = start_column
@@ -127,6 +148,404 @@ class Value(wrapt.ObjectProxy, typing.Generic[T]):  # pyright: ignore [reportUnt
         self._self_comment: str | None = comment
         self._self_metadata: dict[str, typing.Any] = kwargs
 
+    def _self_positions(self) -> tuple[Pointer, Pointer, Pointer, Pointer]:
+        """Source positions of the value as a single tuple.
+
+        Note:
+            The `_self_` prefix keeps the proxy transparent (any
+            other name could shadow an attribute of the wrapped
+            value); bundling the four pointers saves repeated
+            attribute lookups on the error path.
+
+        Returns:
+            Start line, start column, end line and end column.
+
+        """
+        return (
+            self._self_start_line,
+            self._self_start_column,
+            self._self_end_line,
+            self._self_end_column,
+        )
+
+    @property
+    def __class__(self) -> type:  # pyright: ignore[reportIncompatibleMethodOverride, reportImplicitOverride]
+        """Class of the __wrapped__ value.
+
+        Note:
+            Forwarding `__class__` makes `isinstance` checks
+            (e.g. against `Mapping` in [`lintkit.check.Contains`][])
+            treat the proxy as the wrapped value itself.
+
+        Returns:
+            Type of the wrapped value.
+
+        """
+        return type(self.__wrapped__)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        """Forward attribute access to the wrapped value.
+
+        Args:
+            name:
+                Name of the attribute to access.
+
+        Returns:
+            Attribute of the wrapped value.
+
+        """
+        return getattr(self.__wrapped__, name)
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """Debug representation exposing the wrapped value.
+
+        Returns:
+            Representation of the proxy and the wrapped value.
+
+        """
+        return f"{type(self).__name__}({self.__wrapped__!r})"
+
+    def __str__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        """String representation of the wrapped value.
+
+        Returns:
+            Wrapped value converted to a string.
+
+        """
+        return str(self.__wrapped__)
+
+    def __bool__(self) -> bool:
+        """Truthiness of the wrapped value.
+
+        Returns:
+            Truthiness of the wrapped value.
+
+        """
+        return bool(self.__wrapped__)
+
+    def __eq__(self, other: object) -> bool:  # pyright: ignore[reportImplicitOverride]
+        """Compare the wrapped value for equality.
+
+        Args:
+            other:
+                Object to compare against (unwrapped if
+                it is a `Value` itself).
+
+        Returns:
+            Whether the wrapped value equals `other`.
+
+        """
+        if isinstance(other, Value):
+            other = other.__wrapped__
+        return self.__wrapped__ == other
+
+    def __ne__(self, other: object) -> bool:  # pyright: ignore[reportImplicitOverride]
+        """Compare the wrapped value for inequality.
+
+        Args:
+            other:
+                Object to compare against (unwrapped if
+                it is a `Value` itself).
+
+        Returns:
+            Whether the wrapped value differs from `other`.
+
+        """
+        return not self.__eq__(other)
+
+    def __lt__(self, other: typing.Any) -> bool:
+        """Compare the wrapped value with `other` (`<`).
+
+        Args:
+            other:
+                Object to compare against (unwrapped if
+                it is a `Value` itself).
+
+        Returns:
+            Whether the wrapped value is smaller than `other`.
+
+        """
+        if isinstance(other, Value):
+            other = other.__wrapped__
+        return self.__wrapped__ < other
+
+    def __le__(self, other: typing.Any) -> bool:
+        """Compare the wrapped value with `other` (`<=`).
+
+        Args:
+            other:
+                Object to compare against (unwrapped if
+                it is a `Value` itself).
+
+        Returns:
+            Whether the wrapped value is smaller than
+            (or equal to) `other`.
+
+        """
+        if isinstance(other, Value):
+            other = other.__wrapped__
+        return self.__wrapped__ <= other
+
+    def __gt__(self, other: typing.Any) -> bool:
+        """Compare the wrapped value with `other` (`>`).
+
+        Args:
+            other:
+                Object to compare against (unwrapped if
+                it is a `Value` itself).
+
+        Returns:
+            Whether the wrapped value is greater than `other`.
+
+        """
+        if isinstance(other, Value):
+            other = other.__wrapped__
+        return self.__wrapped__ > other
+
+    def __ge__(self, other: typing.Any) -> bool:
+        """Compare the wrapped value with `other` (`>=`).
+
+        Args:
+            other:
+                Object to compare against (unwrapped if
+                it is a `Value` itself).
+
+        Returns:
+            Whether the wrapped value is greater than
+            (or equal to) `other`.
+
+        """
+        if isinstance(other, Value):
+            other = other.__wrapped__
+        return self.__wrapped__ >= other
+
+    def __add__(self, other: typing.Any) -> typing.Any:
+        """Add `other` to the wrapped value.
+
+        Note:
+            Returns the plain result (not a `Value`), matching
+            how wrapped scalars are expected to behave in rule
+            `check` implementations.
+
+        Args:
+            other:
+                Object to add (unwrapped if it is a `Value` itself).
+
+        Returns:
+            Sum of the wrapped value and `other`.
+
+        """
+        if isinstance(other, Value):
+            other = other.__wrapped__
+        return self.__wrapped__ + other
+
+    def __sub__(self, other: typing.Any) -> typing.Any:
+        """Subtract `other` from the wrapped value.
+
+        Args:
+            other:
+                Object to subtract (unwrapped if it is a `Value` itself).
+
+        Returns:
+            Difference of the wrapped value and `other`.
+
+        """
+        if isinstance(other, Value):
+            other = other.__wrapped__
+        return self.__wrapped__ - other
+
+    def __mul__(self, other: typing.Any) -> typing.Any:
+        """Multiply the wrapped value by `other`.
+
+        Args:
+            other:
+                Object to multiply by (unwrapped if it is a `Value` itself).
+
+        Returns:
+            Product of the wrapped value and `other`.
+
+        """
+        if isinstance(other, Value):
+            other = other.__wrapped__
+        return self.__wrapped__ * other
+
+    def __truediv__(self, other: typing.Any) -> typing.Any:
+        """Divide the wrapped value by `other` (`/`).
+
+        Args:
+            other:
+                Object to divide by (unwrapped if it is a `Value` itself).
+
+        Returns:
+            Quotient of the wrapped value and `other`.
+
+        """
+        if isinstance(other, Value):
+            other = other.__wrapped__
+        return self.__wrapped__ / other
+
+    def __floordiv__(self, other: typing.Any) -> typing.Any:
+        """Divide the wrapped value by `other` (`//`).
+
+        Args:
+            other:
+                Object to divide by (unwrapped if it is a `Value` itself).
+
+        Returns:
+            Floored quotient of the wrapped value and `other`.
+
+        """
+        if isinstance(other, Value):
+            other = other.__wrapped__
+        return self.__wrapped__ // other
+
+    def __mod__(self, other: typing.Any) -> typing.Any:
+        """Take the wrapped value modulo `other`.
+
+        Args:
+            other:
+                Object to take the modulo with (unwrapped if it is
+                a `Value` itself).
+
+        Returns:
+            Wrapped value modulo `other`.
+
+        """
+        if isinstance(other, Value):
+            other = other.__wrapped__
+        return self.__wrapped__ % other
+
+    def __pow__(self, other: typing.Any) -> typing.Any:
+        """Raise the wrapped value to the power of `other`.
+
+        Args:
+            other:
+                Exponent to use (unwrapped if it is a `Value` itself).
+
+        Returns:
+            Wrapped value raised to the power of `other`.
+
+        """
+        if isinstance(other, Value):
+            other = other.__wrapped__
+        return self.__wrapped__**other
+
+    def __neg__(self) -> typing.Any:
+        """Negate the wrapped value.
+
+        Returns:
+            Negated wrapped value.
+
+        """
+        return -self.__wrapped__  # pyright: ignore[reportOperatorIssue]
+
+    def __abs__(self) -> typing.Any:
+        """Absolute value of the wrapped value.
+
+        Returns:
+            Absolute value of the wrapped value.
+
+        """
+        return abs(self.__wrapped__)  # pyright: ignore[reportArgumentType]
+
+    def __int__(self) -> int:
+        """Convert the wrapped value to an `int`.
+
+        Returns:
+            The wrapped value as an `int`.
+
+        """
+        return int(self.__wrapped__)  # pyright: ignore[reportArgumentType]
+
+    def __float__(self) -> float:
+        """Convert the wrapped value to a `float`.
+
+        Returns:
+            The wrapped value as a `float`.
+
+        """
+        return float(self.__wrapped__)  # pyright: ignore[reportArgumentType]
+
+    def __index__(self) -> int:
+        """Losslessly convert the wrapped value to an `int`.
+
+        Note:
+            Makes wrapped integers usable for indexing, slicing
+            and the `int`-expecting stdlib (e.g. `range`, `hex`).
+
+        Returns:
+            The wrapped value as an `int`.
+
+        """
+        return operator.index(self.__wrapped__)  # pyright: ignore[reportArgumentType]
+
+    def __hash__(self) -> int:  # pyright: ignore[reportImplicitOverride]
+        """Hash of the wrapped value.
+
+        Note:
+            Matching the wrapped value's hash (and equality above)
+            allows proxied keys to be looked up with plain ones,
+            e.g. in parsed `YAML` mappings.
+
+        Returns:
+            Hash of the wrapped value.
+
+        """
+        return hash(self.__wrapped__)
+
+    def __iter__(self) -> Iterator[typing.Any]:
+        """Iterate over the wrapped value.
+
+        Returns:
+            Iterator over the wrapped value.
+
+        """
+        return iter(self.__wrapped__)  # pyright: ignore[reportArgumentType, reportCallIssue]
+
+    def __next__(self) -> typing.Any:
+        """Advance the wrapped iterator/generator.
+
+        Returns:
+            Next item of the wrapped value.
+
+        """
+        return next(self.__wrapped__)  # pyright: ignore[reportArgumentType]
+
+    def __len__(self) -> int:
+        """Length of the wrapped value.
+
+        Returns:
+            Length of the wrapped value.
+
+        """
+        return len(self.__wrapped__)  # pyright: ignore[reportArgumentType]
+
+    def __contains__(self, item: typing.Any) -> bool:
+        """Check containment within the wrapped value.
+
+        Args:
+            item:
+                Item to look for in the wrapped value.
+
+        Returns:
+            Whether `item` is contained in the wrapped value.
+
+        """
+        return item in self.__wrapped__
+
+    def __getitem__(self, key: typing.Any) -> typing.Any:
+        """Get an item from the wrapped value.
+
+        Args:
+            key:
+                Key (or index) to look up.
+
+        Returns:
+            Item of the wrapped value under `key`.
+
+        """
+        return self.__wrapped__[key]  # pyright: ignore[reportIndexIssue]
+
     @staticmethod
     def from_python(value: T, node: ast.AST) -> Value[T]:
         """Create a `Value` from Python's `ast.AST` node.
@@ -144,10 +563,10 @@ class Value(wrapt.ObjectProxy, typing.Generic[T]):  # pyright: ignore [reportUnt
         """
         return Value(
             value=value,
-            start_line=_optional_get(node, "lineno"),
-            start_column=_optional_get(node, "col_offset"),
-            end_line=_optional_get(node, "end_lineno"),
-            end_column=_optional_get(node, "end_col_offset"),
+            start_line=_pointer(node, "lineno"),
+            start_column=_pointer(node, "col_offset"),
+            end_line=_pointer(node, "end_lineno"),
+            end_column=_pointer(node, "end_col_offset"),
         )
 
     @staticmethod
@@ -227,12 +646,10 @@ class Value(wrapt.ObjectProxy, typing.Generic[T]):  # pyright: ignore [reportUnt
             """
             return Value(
                 value=value,
-                start_line=_optional_get(node, "start_mark", "line", offset=1),
-                start_column=_optional_get(
-                    node, "start_mark", "column", offset=1
-                ),
-                end_line=_optional_get(node, "end_mark", "line", offset=1),
-                end_column=_optional_get(node, "end_mark", "column", offset=1),
+                start_line=_nested_pointer(node, "start_mark", "line", 1),
+                start_column=_nested_pointer(node, "start_mark", "column", 1),
+                end_line=_nested_pointer(node, "end_mark", "line", 1),
+                end_column=_nested_pointer(node, "end_mark", "column", 1),
                 style=getattr(node, "style", None),
             )
 
@@ -240,7 +657,7 @@ class Value(wrapt.ObjectProxy, typing.Generic[T]):  # pyright: ignore [reportUnt
         pass
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class Pointer:
     """Pointer to the source code (e.g. `start_line`).
 
@@ -253,6 +670,11 @@ class Pointer:
         It is used internally by the `Value` class to represent
         line and column numbers as a lightweight wrapper.
 
+    Note:
+        Four pointers are allocated per [`lintkit.Value`][] (which
+        can mean one per AST node), hence `slots` (no `__dict__`)
+        and `frozen` (hashable, safely shareable).
+
     Attributes:
         value:
             Line or column number, or None if not available.
@@ -276,50 +698,72 @@ class Pointer:
     def __bool__(self) -> bool:
         """Check if the pointer has a `value`.
 
+        Note:
+            Pointers reach user-supplied output functions via
+            [`lintkit.rule.Rule.error`][], hence truthiness has
+            to keep meaning "has a value" there.
+
         Returns:
             `True` if the pointer has a `value`, `False` if it is `None`.
 
         """
         return self.value is not None
 
-    def __add__(self, other: int) -> Pointer:
-        """Add an integer to the pointer value.
 
-        Allows to offset the pointer by a specific number
-        (usually for compatibility reasons between different
-        libraries and formats).
+_NULL_POINTER = Pointer()
+"""Shared empty `Pointer` (safe to reuse as `Pointer` is frozen)."""
 
-        Args:
-            other: Integer to add to the pointer value.
 
-        Returns:
-            A new `Pointer` instance with the updated value.
+def _pointer(node: typing.Any, attribute: str) -> Pointer:
+    """Obtain a given attribute and transform it to `Pointer`.
 
-        """
-        if self.value is None:
-            return Pointer()  # pragma: no cover
-        return Pointer(self.value + other)
+    Note:
+        Specialized single-attribute variant (four calls per
+        [`lintkit.Value.from_python`][]), avoiding the variadic
+        loop of a generic walker.
 
+    Args:
+        node:
+            Node from which to obtain the attribute.
+        attribute:
+            Name of the attribute to obtain (if it exists).
+
+    Returns:
+        Pointer with the attribute value (empty if missing).
 
-def _optional_get(
-    node: typing.Any, *attributes: str, offset: int = 0
-) -> typing.Any | None:
-    """Recursively obtain a given attribute and transform it to `Pointer`.
+    """
+    value = getattr(node, attribute, None)
+    if value is None:  # pragma: no cover
+        return _NULL_POINTER
+    return Pointer(value)
+
+
+def _nested_pointer(
+    node: typing.Any, outer: str, inner: str, offset: int
+) -> Pointer:
+    """Obtain a nested attribute and transform it to `Pointer`.
+
+    Note:
+        Specialized two-attribute variant used for `YAML` marks
+        (e.g. `node.start_mark.line`).
 
     Args:
         node:
-            Node from which to obtain attributes.
-        *attributes:
-            Names of the attributes to obtain (if these exist).
+            Node from which to obtain the attributes.
+        outer:
+            Name of the outer attribute (if it exists).
+        inner:
+            Name of the inner attribute (if it exists).
         offset:
-            Pointer offset for the value, if any
+            Pointer offset for the value
             (useful in `YAML` 0-indexed positioning).
 
-    """
-    current = node
-    for attribute in attributes:
-        current = getattr(current, attribute, None)
-        if current is None:  # pragma: no cover
-            return Pointer()
+    Returns:
+        Pointer with the offset attribute value (empty if missing).
 
-    return Pointer(current) + offset
+    """
+    mark = getattr(node, outer, None)
+    value = getattr(mark, inner, None) if mark is not None else None
+    if value is None:  # pragma: no cover
+        return _NULL_POINTER
+    return Pointer(value + offset)
@@ -23,7 +23,31 @@ Example:
 
 from __future__ import annotations
 
+import functools
 import importlib.util
+import sys
+
+
+@functools.cache
+def _module_exists(name: str) -> bool:
+    """Check if a single module is installed (memoized).
+
+    Note:
+        `find_spec` walks `sys.meta_path` (possibly stat-ing the
+        filesystem), hence results are cached so repeated queries
+        do not re-pay the lookup.
+
+    Args:
+        name: Module name to check.
+
+    Returns:
+        True if the module is installed, False otherwise.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):  # pragma: no cover
+        # Broken/partially-removed packages should not crash the import
+        return False
 
 
 def _modules_exist(*names: str) -> bool:
@@ -38,7 +62,7 @@ def _modules_exist(*names: str) -> bool:
     Returns:
         True if all modules are installed, False otherwise.
     """
-    return all(importlib.util.find_spec(name) is not None for name in names)
+    return all(_module_exists(name) for name in names)
 
 
 RICH: bool = _modules_exist("rich")
@@ -53,8 +77,33 @@ YAML: bool = _modules_exist("ruamel")
 Used to parse `YAML` and create rules for it.
 """
 
+YAML_C: bool = YAML and _modules_exist("_ruamel_yaml")
+"""`Bool` indicating `ruamel.yaml.clib` (LibYAML bindings) availability.
+
+Used to parse `YAML` with the C-backed parser when installed.
+"""
+
 TOML: bool = _modules_exist("tomlkit")
 """`Bool` indicating [tomlkit](https://tomlkit.readthedocs.io) availability.
 
 Used to parse `TOML` and create rules for it.
 """
+
+ORJSON: bool = _modules_exist("orjson")
+"""`Bool` indicating [orjson](https://github.com/ijl/orjson) availability.
+
+Used to parse (strictly valid) `JSON` with a Rust-backed parser
+when installed.
+"""
+
+RE2: bool = _modules_exist("re2")
+"""`Bool` indicating [google-re2](https://github.com/google/re2) availability.
+
+Used to match ignore-comment patterns with a linear-time DFA engine.
+"""
+
+LIBURING: bool = sys.platform == "linux" and _modules_exist("liburing")
+"""`Bool` for [liburing](https://github.com/YoSTEALTH/Liburing) availability.
+
+Used to batch file reads via `io_uring` (Linux only).
+"""
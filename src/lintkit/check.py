@@ -19,6 +19,7 @@ Tip:
 from __future__ import annotations
 
 import abc
+import functools
 import re
 import typing
 
@@ -32,6 +33,31 @@ if typing.TYPE_CHECKING:
 
 T = typing.TypeVar("T")
 
+_MISSING = object()
+"""Sentinel distinguishing absent keys from stored `None` values."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(pattern: str, flags: int) -> re.Pattern[str]:
+    """Compile `pattern` with memoization shared across rules.
+
+    Note:
+        Keyed on `(pattern, flags)` hence rules (or rule instances)
+        sharing the same pattern reuse one compiled object, with
+        bounded memory for dynamically generated patterns.
+
+    Args:
+        pattern:
+            Regex pattern to compile.
+        flags:
+            Regex flags to apply.
+
+    Returns:
+        Compiled regex pattern.
+
+    """
+    return re.compile(pattern, flags)
+
 
 class Check(abc.ABC):
     """Base class (interface) for performing checks against `value`.
@@ -115,6 +141,26 @@ class Regex(Check, abc.ABC):
         """
         return re.NOFLAG
 
+    @functools.cached_property
+    def _compiled_regex(self) -> re.Pattern[str]:
+        """Compiled `regex()` pattern, cached per rule instance.
+
+        Note:
+            `regex()` and `regex_flags()` conventionally return
+            constants, hence the pattern is compiled once and the
+            hot `check` path goes straight to `re.Pattern.search`.
+
+        Tip:
+            If your subclass legitimately changes its `regex()`
+            per-call, override this property with a plain one
+            delegating to the memoized module-level `_compile`.
+
+        Returns:
+            Compiled regex pattern with `regex_flags()` applied.
+
+        """
+        return _compile(self.regex(), self.regex_flags())
+
     def check(self, value: Value[str | None]) -> bool:  # pyright: ignore[reportImplicitOverride]
         """Check if the node matches the regex pattern.
 
@@ -137,10 +183,8 @@ class Regex(Check, abc.ABC):
         # Have to unpack `Value` due to re.compile checks allowing only str
         return (
             value.__wrapped__ is None
-            or re.search(
-                self.regex(),
-                value.__wrapped__,  # pyright: ignore[reportUnknownArgumentType]
-                flags=self.regex_flags(),
+            or self._compiled_regex.search(
+                value.__wrapped__,
             )
             is not None
         )
@@ -189,6 +233,21 @@ class Contains(Check, abc.ABC):
         """
         raise NotImplementedError
 
+    @functools.cached_property
+    def _keys(self) -> tuple[Hashable, ...]:
+        """`keys()` materialized as a tuple, cached per rule instance.
+
+        Note:
+            `keys()` is conventionally constant, hence a possibly
+            generator-backed implementation is only invoked once
+            instead of on every checked value.
+
+        Returns:
+            Keys to check for, as a tuple.
+
+        """
+        return tuple(self.keys())
+
     def check(  # pyright: ignore[reportImplicitOverride]
         self,
         value: Value[type_definitions.GetItem | None],
@@ -210,12 +269,12 @@ class Contains(Check, abc.ABC):
 
         """
         current_value = value
-        for key in self.keys():
-            if (
-                not isinstance(current_value, Mapping)
-                or key not in current_value
-            ):
+        for key in self._keys:
+            if not isinstance(current_value, Mapping):
+                return False
+            # Single lookup instead of `in` + `__getitem__`
+            current_value = current_value.get(key, _MISSING)
+            if current_value is _MISSING:
                 return False
-            current_value = current_value[key]
 
         return True
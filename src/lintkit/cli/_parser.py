@@ -152,6 +152,17 @@ def _check(
         """),
     )
 
+    _ = parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=textwrap.dedent("""\
+        Number of worker processes used to lint files in parallel.
+
+        Default: 1 (run everything in the current process)
+        """),
+    )
+
     _ = parser.add_argument(
         "--end_mode",
         choices=["all", "first"],
@@ -51,6 +51,7 @@ def check(
             exclude_codes,
             end_mode,
             output=False,
+            jobs=args.jobs,
         )
     )
 
@@ -268,8 +268,9 @@ class CodeNegativeError(LintkitError):
         self.code = code
         self.rule = rule
 
+        # `rule` is already a class, `type(rule)` would be the metaclass
         self.message = (
-            f"Rule '{type(rule).__name__}' has code '{code}' "
+            f"Rule '{rule.__name__}' has code '{code}' "
             f"which should be a positive 'int'."
         )
         super().__init__(self.message)
@@ -323,9 +324,12 @@ class CodeExistsError(LintkitError):
         self.new_rule = new_rule
         self.old_rule = old_rule
 
+        # `new_rule` is already a class (`old_rule` is an instance)
+        new_name = new_rule.__name__
+        old_name = type(old_rule).__name__
         self.message = (
-            f"Rule '{type(new_rule).__name__}' cannot be registered with code '{code}' "
-            f"as it is already taken by '{type(old_rule).__name__}'."
+            f"Rule '{new_name}' cannot be registered with code '{code}' "
+            f"as it is already taken by '{old_name}'."
         )
         super().__init__(self.message)
 
@@ -41,21 +41,100 @@ import abc
 import ast
 import collections
 import functools
+import hashlib
+import itertools
 import json
+import pickle
+import tomllib
 import typing
 
-from . import available
+from . import available, settings
 from ._value import Value
 
 if typing.TYPE_CHECKING:
     import pathlib
+    import re
 
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
-    from ._ignore import Span
+    from ._ignore import Spans
 
-_last_loader_index: int = -1
-"""Last index of the loader, used to create unique indices for each."""
+if available.ORJSON:  # pragma: no cover
+    import orjson
+
+    _json_loads: Callable[[str], typing.Any] = orjson.loads
+else:  # pragma: no cover
+    _json_loads = json.loads
+
+_loader_index_counter = itertools.count()
+"""Counter yielding a unique index for each loader."""
+
+
+def _disk_cached(
+    kind: str,
+    content: str,
+    parse: Callable[[str], typing.Any],
+) -> typing.Any:
+    """Parse `content` through the on-disk artifact cache.
+
+    Note:
+        Keyed by a hash of the content (not the path), hence moved
+        or duplicated files share entries and stale entries are
+        simply never hit again.
+
+    Args:
+        kind:
+            Artifact namespace (e.g. `"python"`), keeps differently
+            parsed representations of equal content apart.
+        content:
+            Raw file content to parse.
+        parse:
+            Parser invoked on a cache miss.
+
+    Returns:
+        The parsed (possibly cached) representation.
+
+    """
+    key = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+    path = settings.disk_cache_dir / f"{kind}-{key}.pickle"
+    try:
+        with path.open("rb") as handle:
+            return pickle.load(handle)  # noqa: S301
+    except (OSError, pickle.PickleError, EOFError):  # noqa: S110
+        pass
+
+    data = parse(content)
+    # Failure to persist should never fail the lint run
+    try:
+        settings.disk_cache_dir.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as handle:
+            pickle.dump(data, handle)
+    except (OSError, pickle.PicklingError):  # noqa: S110  # pragma: no cover
+        pass
+    return data
+
+
+@functools.lru_cache(maxsize=8)
+def _content_has_ignores(pattern: re.Pattern[str], content: str) -> bool:
+    """Check whether `content` mentions an ignore comment at all.
+
+    Note:
+        The code-agnostic ignore pattern is shared by every rule of a
+        linter (one compiled instance), hence memoizing on
+        `(pattern, content)` scans each file once per run instead of
+        once per rule.
+
+    Args:
+        pattern:
+            Code-agnostic ignore-line pattern.
+        content:
+            Raw file content.
+
+    Returns:
+        `True` if any ignore comment is present.
+
+    """
+    return pattern.search(content) is not None
 
 
 def _create_loader_index() -> int:
@@ -74,9 +153,7 @@ def _create_loader_index() -> int:
         A unique index for the loader, incremented by one.
 
     """
-    global _last_loader_index  # noqa: PLW0603
-    _last_loader_index += 1
-    return _last_loader_index
+    return next(_loader_index_counter)
 
 
 class Loader(abc.ABC):
@@ -107,13 +184,13 @@ class Loader(abc.ABC):
 
     """
 
-    _loader_data: typing.ClassVar[
-        collections.defaultdict[int, collections.defaultdict[str, typing.Any]]
-    ] = collections.defaultdict(lambda: collections.defaultdict(lambda: None))
+    _loader_data: typing.ClassVar[dict[tuple[int, str], typing.Any]] = {}
     """Where all the data is stored internally.
 
     Important:
-        This mapping is `cls._loader_index` to enable per-class data keeping.
+        This mapping is keyed by `(cls._loader_index, key)` tuples
+        to enable per-class data keeping with a single dictionary
+        lookup per access.
 
     """
 
@@ -125,7 +202,7 @@ class Loader(abc.ABC):
 
     """
 
-    _lines: list[str] | None = None
+    _lines: Sequence[str] | None = None
     """Content split by lines. Used in multiple places, hence cached.
 
     Info:
@@ -133,7 +210,7 @@ class Loader(abc.ABC):
 
     """
 
-    _ignore_spans: list[Span] | None = None
+    _ignore_spans: Spans | None = None
     """Text spans where the rules should be ignored.
 
     Info:
@@ -141,6 +218,54 @@ class Loader(abc.ABC):
 
     """
 
+    _line_cache: dict[int, bool] | None = None
+    """Per-file memo of the line-ignore regex verdict by line number.
+
+    Info:
+        Will be populated by [`lintkit.loader`][], initially `None`.
+
+    """
+
+    _LOADED_MARKER: typing.ClassVar[str] = "__loaded__"
+    """Reserved `_loader_data` key tracking what a loader has parsed.
+
+    Note:
+        Holds a `(file, content_hash)` tuple __per loader index__
+        (i.e. shared by every rule using that loader), hence a file
+        is parsed once per loader kind instead of once per rule
+        class, and an edited file arriving under an unchanged path
+        still reloads.
+
+    """
+
+    _has_ignores: bool = False
+    """Whether the current file can ignore values at all.
+
+    Note:
+        `False` (no spans and no ignore-comment mention anywhere in
+        the content) lets rules skip `ignored()` per value entirely.
+
+    Info:
+        Will be populated by [`lintkit.loader`][], initially `False`.
+
+    """
+
+    _printer: typing.Any = None
+    """Output function resolved once per file instead of per error.
+
+    Info:
+        Will be populated by [`lintkit.loader`][], initially `None`.
+
+    """
+
+    _linter_name: str | None = None
+    """Linter name resolved once per file instead of per error.
+
+    Info:
+        Will be populated by [`lintkit.loader`][], initially `None`.
+
+    """
+
     @classmethod
     @abc.abstractmethod
     def skip(cls, file: pathlib.Path, content: str) -> bool:
@@ -217,7 +342,7 @@ class Loader(abc.ABC):
             key:
                 The key to retrieve the value for.
         """
-        return Loader._loader_data[cls._loader_index][key]
+        return Loader._loader_data.get((cls._loader_index, key))
 
     @classmethod
     def setitem(cls, key: str, value: typing.Any) -> None:
@@ -239,7 +364,7 @@ class Loader(abc.ABC):
             value:
                 The value to set for the given key.
         """
-        Loader._loader_data[cls._loader_index][key] = value
+        Loader._loader_data[cls._loader_index, key] = value
 
     @classmethod
     def reset(cls) -> None:
@@ -250,17 +375,15 @@ class Loader(abc.ABC):
             to be called directly.
 
         """
-        Loader._loader_data = collections.defaultdict(
-            lambda: collections.defaultdict(lambda: None)
-        )
+        Loader._loader_data.clear()
 
     @classmethod
     def _run_load(
         cls,
         file: pathlib.Path,
         content: str,
-        lines: list[str],
-        ignore_spans: list[Span],
+        lines: Sequence[str],
+        ignore_spans: Spans,
     ) -> None:
         """Load contents of the file.
 
@@ -281,15 +404,33 @@ class Loader(abc.ABC):
                 Spans containing lines to ignore in the file
 
         """
-        # It is enough to compare the files as the full path
-        # is unique (while multiple files can have the same content)
-        file_changed = cls.file is None or file != cls.file
-        if file_changed or not cls.should_cache():
+        # The marker is shared by all rules of a loader kind: only
+        # the first one to see a (file, content) pair pays `load`,
+        # and an edited file under an unchanged path still reloads
+        marker_key = (cls._loader_index, cls._LOADED_MARKER)
+        loaded = (file, hash(content))
+        if (
+            Loader._loader_data.get(marker_key) != loaded
+            or not cls.should_cache()
+        ):
             cls.load(file, content)
+            Loader._loader_data[marker_key] = loaded
         cls.file = file
         cls.content = content
         cls._lines = lines
         cls._ignore_spans = ignore_spans
+        cls._line_cache = {}
+        ignore_line_any = getattr(cls, "_ignore_line_any", None)
+        # No prefilter (custom `settings.ignore_line` shape):
+        # conservatively assume line ignores may be present
+        cls._has_ignores = bool(ignore_spans) or (
+            ignore_line_any is None
+            or _content_has_ignores(ignore_line_any, content)
+        )
+        # `staticmethod` so instance access does not bind the rule
+        # as the printer's first argument
+        cls._printer = staticmethod(settings._output())  # noqa: SLF001
+        cls._linter_name = settings._name()  # noqa: SLF001
 
     @classmethod
     def _run_reset(cls) -> None:
@@ -298,9 +439,40 @@ class Loader(abc.ABC):
         cls.file = None
         cls._lines = None
         cls._ignore_spans = None
+        cls._line_cache = None
+        cls._has_ignores = False
+        cls._printer = None
+        cls._linter_name = None
         cls.reset()
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_python(content: str) -> ast.AST:
+    """Parse Python source, memoizing by content.
+
+    Note:
+        `ast.parse` is O(n) in source length and dominates the
+        `Python` loader; identical sources encountered again
+        (e.g. across runs without a registry change) reuse the
+        previously built tree.
+
+    Warning:
+        The returned tree is shared, hence rules __must not mutate__
+        the nodes they receive.
+
+    Args:
+        content:
+            Python source code to parse.
+
+    Returns:
+        The parsed abstract syntax tree.
+
+    """
+    if settings.disk_cache:
+        return _disk_cached("python", content, ast.parse)
+    return ast.parse(content)
+
+
 class Python(Loader):
     """Loader of `Python` files providing access to `ast` of the source code.
 
@@ -322,10 +494,21 @@ class Python(Loader):
         Parsed `ast` is cached, but still might be slower
         than targeted loaders.
 
+    Note:
+        The derived collections (`nodes_direct`, `nodes_recursive`,
+        `nodes_map`) are materialized lazily on first `getitem`
+        access; rules needing only the raw `ast` skip the full
+        tree traversal entirely.
+
     """
 
     _loader_index: int = _create_loader_index()
 
+    _DERIVED: typing.ClassVar[frozenset[str]] = frozenset(
+        {"nodes_direct", "nodes_recursive", "nodes_map"}
+    )
+    """Keys computed on demand from the parsed `ast`."""
+
     @classmethod
     def skip(cls, file: pathlib.Path, _: str) -> bool:  # pyright: ignore [reportImplicitOverride, reportIncompatibleMethodOverride]
         """Skip loading if the file is not a Python file.
@@ -358,8 +541,9 @@ class Python(Loader):
         """Load the content of the Python file and cache the AST.
 
         Note:
-            The loaded data is saved under the `ast`, `nodes_direct`,
-            `nodes_recursive`, and `nodes_map` keys.
+            The loaded data is saved under the `ast` key;
+            `nodes_direct`, `nodes_recursive`, and `nodes_map`
+            are materialized lazily on first access.
 
         Args:
             _:
@@ -370,17 +554,54 @@ class Python(Loader):
         Raises:
             SyntaxError: If the content is not valid Python code.
         """
-        ast_ = ast.parse(content)
-        nodes_direct = list(ast.iter_child_nodes(ast_))
-        nodes_recursive = list(ast.walk(ast_))
-        nodes_map = collections.defaultdict(list)
-        for node in nodes_recursive:
-            nodes_map[type(node)].append(node)
-
-        cls.setitem("ast", ast_)
-        cls.setitem("nodes_direct", nodes_direct)
+        cls.setitem("ast", _parse_python(content))
+        # Derived collections of the previous file are stale now
+        for key in cls._DERIVED:
+            cls.setitem(key, None)
+
+    @classmethod
+    def getitem(cls, key: str) -> typing.Any:  # pyright: ignore [reportImplicitOverride]
+        """Get an item, materializing derived collections on demand.
+
+        Note:
+            See [`lintkit.loader.Loader.getitem`][] for the general
+            contract; this override only adds lazy computation of
+            `nodes_direct`, `nodes_recursive` and `nodes_map`.
+
+        Args:
+            key:
+                The key to retrieve the value for.
+        """
+        value = super().getitem(key)
+        if value is None and key in cls._DERIVED:
+            cls._materialize_nodes()
+            value = super().getitem(key)
+        return value
+
+    @classmethod
+    def _materialize_nodes(cls) -> None:
+        """Compute the node collections from the cached `ast`."""
+        ast_ = Python.getitem("ast")
+
+        # Fused breadth-first traversal (same order as `ast.walk`);
+        # a single pass fills both the flat list and the type map
+        nodes_recursive: list[ast.AST] = []
+        nodes_map: dict[type, list[ast.AST]] = {}
+        queue = collections.deque((ast_,))
+        while queue:
+            node = queue.popleft()
+            nodes_recursive.append(node)
+            bucket = nodes_map.get(type(node))  # pyright: ignore[reportUnknownArgumentType]
+            if bucket is None:
+                nodes_map[type(node)] = bucket = []
+            bucket.append(node)
+            queue.extend(ast.iter_child_nodes(node))
+
+        cls.setitem("nodes_direct", list(ast.iter_child_nodes(ast_)))
         cls.setitem("nodes_recursive", nodes_recursive)
-        cls.setitem("nodes_map", nodes_map)
+        # Wrapped so rules reading an absent node type keep getting
+        # an empty list (documented behavior)
+        cls.setitem("nodes_map", collections.defaultdict(list, nodes_map))
 
 
 class _ConfigLoader(Loader, abc.ABC):
@@ -392,16 +613,14 @@ class _ConfigLoader(Loader, abc.ABC):
 
     """
 
-    @classmethod
-    @abc.abstractmethod
-    def _extensions(cls) -> set[str]:
-        """Extensions of a given format.
+    _EXTENSIONS: typing.ClassVar[frozenset[str]]
+    """Extensions of a given format (e.g. `{".yaml", ".yml"}`).
 
-        Returns:
-            A set of file extensions that this loader can handle.
-            For example, `{"json"}`, `{"yaml", "yml"}`, etc.
-        """
-        raise NotImplementedError
+    Note:
+        Defined once at class-definition time so `skip` (called for
+        every `(file, loader)` pair) avoids rebuilding a `set` per call.
+
+    """
 
     @classmethod
     @abc.abstractmethod
@@ -484,7 +703,38 @@ class _ConfigLoader(Loader, abc.ABC):
             `False` otherwise.
 
         """
-        return file.suffix not in cls._extensions()
+        return file.suffix not in cls._EXTENSIONS
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_json(content: str) -> typing.Any:
+    """Parse `JSON` content, memoizing by content.
+
+    Note:
+        Mirrors `_parse_python`: identical sources met again
+        (e.g. across runs without a registry change) reuse the
+        previously parsed data.
+
+    Note:
+        Uses [orjson](https://github.com/ijl/orjson) when installed
+        (see [`lintkit.available.ORJSON`][]), which is several times
+        faster than the standard library parser.
+
+    Warning:
+        The parsed data is shared, hence rules __must not mutate__
+        the objects they receive.
+
+    Args:
+        content:
+            `JSON` document to parse.
+
+    Returns:
+        The parsed data.
+
+    """
+    if settings.disk_cache:
+        return _disk_cached("json", content, _json_loads)
+    return _json_loads(content)
 
 
 class JSON(_ConfigLoader):
@@ -500,17 +750,7 @@ class JSON(_ConfigLoader):
 
     _loader_index: int = _create_loader_index()
 
-    @classmethod
-    def _extensions(cls) -> set[str]:  # pyright: ignore [reportImplicitOverride]
-        """`JSON` file extensions.
-
-        Returns:
-            `{".json"}`.
-
-        """
-        return {
-            ".json",
-        }
+    _EXTENSIONS: typing.ClassVar[frozenset[str]] = frozenset({".json"})
 
     @classmethod
     def _load(cls, _: pathlib.Path, content: str) -> typing.Any:  # pyright: ignore [reportImplicitOverride, reportIncompatibleMethodOverride]
@@ -526,12 +766,61 @@ class JSON(_ConfigLoader):
             The parsed data from the `JSON` file.
 
         """
-        return json.loads(content)
+        return _parse_json(content)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_toml_fast(content: str) -> typing.Any:
+    """Parse `TOML` content with stdlib `tomllib`, memoizing by content.
+
+    Note:
+        `tomllib` is C-backed and several times faster than
+        `tomlkit`, at the cost of returning plain Python objects
+        without comments or formatting.
+
+    Warning:
+        The parsed data is shared, hence rules __must not mutate__
+        the objects they receive.
+
+    Args:
+        content:
+            `TOML` document to parse.
+
+    Returns:
+        The parsed data.
+
+    """
+    return tomllib.loads(content)
 
 
 if available.TOML:
     from tomlkit import parse
 
+    @functools.lru_cache(maxsize=128)
+    def _parse_toml(content: str) -> typing.Any:
+        """Parse `TOML` content, memoizing by content.
+
+        Note:
+            `tomlkit.parse` builds a full round-trip document and is
+            by far the most expensive step of the `TOML` loader;
+            identical sources met again reuse the previous document.
+
+        Warning:
+            The parsed document is shared, hence rules __must not
+            mutate__ the items they receive.
+
+        Args:
+            content:
+                `TOML` document to parse.
+
+        Returns:
+            The parsed document.
+
+        """
+        if settings.disk_cache:
+            return _disk_cached("toml", content, parse)
+        return parse(content)
+
     class TOML(_ConfigLoader):
         """Loader for `TOML` files.
 
@@ -549,17 +838,19 @@ if available.TOML:
 
         _loader_index: int = _create_loader_index()
 
-        @classmethod
-        def _extensions(cls) -> set[str]:  # pyright: ignore [reportImplicitOverride]
-            """`TOML` file extensions.
+        _EXTENSIONS: typing.ClassVar[frozenset[str]] = frozenset({".toml"})
 
-            Returns:
-                `{".toml"}`.
+        round_trip: typing.ClassVar[bool] = True
+        """Whether to parse with `tomlkit` (comment/format preserving).
 
-            """
-            return {
-                ".toml",
-            }
+        Tip:
+            Set to `False` in your rule to parse with the stdlib
+            [`tomllib`](https://docs.python.org/3/library/tomllib.html)
+            instead - several times faster on large files, __but__
+            `data` becomes plain Python objects (no `tomlkit.Items`)
+            and comment-based line ignores are unavailable.
+
+        """
 
         @classmethod
         def _load(cls, _: pathlib.Path, content: str) -> typing.Any:  # pyright: ignore [reportImplicitOverride, reportIncompatibleMethodOverride]
@@ -575,7 +866,9 @@ if available.TOML:
                 The parsed data from the `TOML` file.
 
             """
-            return parse(content)
+            if cls.round_trip:
+                return _parse_toml(content)
+            return _parse_toml_fast(content)
 
 else:  # pragma: no cover
     pass
@@ -583,51 +876,46 @@ else:  # pragma: no cover
 if available.YAML:
     import ruamel.yaml
 
-    P = typing.ParamSpec("P")
-    T = typing.TypeVar("T")
+    # The C-backed (LibYAML) parser pairs with `SafeConstructor`;
+    # the pure-Python round-trip pipeline is the fallback. Line/column
+    # marks (used for `noqa` ignores) are provided by both.
+    _yaml_constructor_base: type = (
+        ruamel.yaml.constructor.SafeConstructor  # pyright: ignore[reportAttributeAccessIssue]
+        if available.YAML_C
+        else ruamel.yaml.constructor.RoundTripConstructor  # pyright: ignore[reportAttributeAccessIssue]
+    )
 
-    def _decorator(func: Callable[P, T]) -> Callable[P, Value[T]]:
-        """Decorator to wrap the return value of a YAML tree in `Value`.
+    class _ValueConstructor(_yaml_constructor_base):  # pyright: ignore[reportUntypedBaseClass, reportGeneralTypeIssues]
+        """Custom constructor for YAML that wraps values in `Value`.
 
-        Args:
-            func:
-                The function to be decorated, (some `construct_*` method
-                of the `ValueConstructor`).
+        Note:
+            `construct_object` is ruamel's central dispatcher, called
+            once per node; overriding it alone replaces wrapping each
+            `construct_*` method (one extra call frame per node instead
+            of one per `construct_*` dispatch).
 
         """
 
-        @functools.wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Value[T]:
-            """Wrapper function to convert the return value to `Value`.
+        def construct_object(
+            self,
+            node: typing.Any,
+            deep: bool = False,  # noqa: FBT001, FBT002
+        ) -> typing.Any:
+            """Construct a node and wrap the result in `Value`.
 
             Args:
-                *args:
-                    Positional arguments passed to the original function.
-                **kwargs:
-                    Keyword arguments passed to the original function.
+                node:
+                    The YAML node to construct.
+                deep:
+                    Whether to construct nested nodes eagerly
+                    (forwarded to ruamel).
 
             Returns:
-                Anything returned by the original function wrapped in `Value`.
-                Usually some sort of YAML node or value.
+                The constructed value wrapped in `Value`.
 
             """
-            return Value._from_yaml(func(*args, **kwargs), args[1])  # noqa: SLF001
-
-        return wrapper
-
-    class _ValueConstructor(ruamel.yaml.constructor.RoundTripConstructor):  # pyright: ignore[reportUntypedBaseClass, reportAttributeAccessIssue]
-        """Custom constructor for YAML that wraps values in `Value`."""
-
-    # Wrap all `construct_*` methods of `_ValueConstructor`
-    # with the decorator. Other options do not seem to work reliably.
-    for attribute in dir(_ValueConstructor):
-        if attribute.startswith("construct_"):
-            function = getattr(_ValueConstructor, attribute)
-            setattr(
-                _ValueConstructor,
-                attribute,
-                _decorator(function),
-            )
+            result = super().construct_object(node, deep=deep)
+            return Value._from_yaml(result, node)  # noqa: SLF001  # pyright: ignore[reportUnknownArgumentType]
 
     class YAML(_ConfigLoader):
         """Loader for `YAML` files.
@@ -648,18 +936,20 @@ if available.YAML:
 
         _loader_index: int = _create_loader_index()
 
-        _ruamel_yaml: ruamel.yaml.YAML = ruamel.yaml.YAML()
+        # `typ="safe"` selects the (much faster) LibYAML parser when
+        # installed; parsed containers are then plain `dict`/`list`
+        # instead of round-trip ones, which is invisible through
+        # `Value` wrapping
+        _ruamel_yaml: ruamel.yaml.YAML = (
+            ruamel.yaml.YAML(typ="safe", pure=False)
+            if available.YAML_C
+            else ruamel.yaml.YAML()
+        )
         _ruamel_yaml.Constructor = _ValueConstructor
 
-        @classmethod
-        def _extensions(cls) -> set[str]:  # pyright: ignore [reportImplicitOverride]
-            """`YAML` file extensions.
-
-            Returns:
-                `{".yaml", ".yml"}`.
-
-            """
-            return {".yaml", ".yml"}
+        _EXTENSIONS: typing.ClassVar[frozenset[str]] = frozenset(
+            {".yaml", ".yml"}
+        )
 
         @classmethod
         def _load(cls, _: pathlib.Path, content: str) -> None:  # pyright: ignore [reportImplicitOverride, reportIncompatibleMethodOverride]
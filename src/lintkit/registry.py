@@ -18,13 +18,20 @@ Tip:
 
 from __future__ import annotations
 
+import collections.abc
+import functools
 import re
 import typing
 
-from . import error, settings
+from . import available, error, settings
 from .loader import Loader
 from .rule import Rule
 
+if available.RE2:  # pragma: no cover
+    import re2  # pyright: ignore[reportMissingImports]
+else:  # pragma: no cover
+    re2 = None
+
 if typing.TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
 
@@ -68,6 +75,11 @@ def inject(attribute: str, value: typing.Any) -> None:
     lintkit.registry.inject("config", config)
     ```
 
+    Note:
+        The attribute is set on the rule's __class__ (rule
+        instances are slotted); each class registers exactly once,
+        hence no per-class deduplication is needed.
+
     Args:
         attribute:
             The name of the attribute to inject.
@@ -107,8 +119,107 @@ def query(
         An iterator over the rules that match the query.
 
     """
+    if include_codes is None and exclude_codes is None:
+        # Scan-everything fast path (the default in CLI usage);
+        # no set materialization nor per-rule membership probes
+        yield from _registry.values()
+        return
+    # Registration (insertion) order regardless of the filter, hence
+    # diagnostics keep a stable rule order across include/exclude sets
     codes = _process(_registry.keys(), include_codes, exclude_codes)
-    return (rule for code, rule in _registry.items() if code in codes)
+    for code, rule in _registry.items():
+        if code in codes:
+            yield rule
+
+
+# This function is used by `_run` to avoid re-querying per run
+@functools.lru_cache(maxsize=8)
+def _cached_query(
+    include_codes: frozenset[int] | None,
+    exclude_codes: frozenset[int] | None,
+) -> tuple[Rule, ...]:
+    """Query the registry with memoization over the filter key.
+
+    Note:
+        `include_codes`/`exclude_codes` are typically fixed for the
+        lifetime of a linter process (CLI arguments), hence repeated
+        runs reuse the same tuple with no re-filtering.
+
+    Warning:
+        The cache is invalidated by `_add` whenever a new rule
+        is registered.
+
+    Args:
+        include_codes:
+            The codes of the rules to include, if any.
+        exclude_codes:
+            The codes of the rules to exclude, if any
+            (takes precedence over `include_codes`).
+
+    Returns:
+        A tuple of rules that match the query.
+
+    """
+    return tuple(
+        query(include_codes=include_codes, exclude_codes=exclude_codes)
+    )
+
+
+def _supports_any_code(template: str) -> bool:
+    """Whether the `code=""` render of `template` is a valid prefilter.
+
+    Note:
+        Shared (any-code) prefilters assume every line matched by a
+        per-code pattern is also matched by the `code=""` render.
+        That holds only when nothing follows `{code}` directly, i.e.
+        each template piece after a `{code}` placeholder is empty or
+        starts with `.*` (as the default templates do); e.g. with a
+        literal right after `{code}` the any-code render would demand
+        the literal where the per-code render has the code.
+
+    Args:
+        template:
+            Ignore template (with `{name}`/`{code}` placeholders).
+
+    Returns:
+        `True` if the `code=""` render matches a superset of every
+        per-code render, `False` otherwise.
+
+    """
+    return all(
+        piece == "" or piece.startswith(".*")
+        for piece in template.split("{code}")[1:]
+    )
+
+
+@functools.cache
+def _compile_ignore(pattern: str) -> re.Pattern[str]:
+    """Compile an ignore-line pattern, memoizing by the final string.
+
+    Note:
+        Registered codes produce near-identical patterns; keying on
+        the fully formatted pattern (rather than `name`/`code`) keeps
+        the cache correct even if `settings.ignore_line` changes
+        between registrations.
+
+    Args:
+        pattern:
+            The fully formatted ignore-line regex.
+
+    Returns:
+        The compiled pattern.
+
+    """
+    if available.RE2 and re2 is not None:  # pragma: no cover
+        try:
+            # Linear-time DFA engine: no backtracking on long lines,
+            # `search`/`Match` interface compatible with `re`
+            return re2.compile(pattern)
+        except re2.error:  # noqa: S110
+            # Constructs RE2 does not support (e.g. backreferences)
+            # keep the stdlib engine
+            pass
+    return re.compile(pattern)
 
 
 # This function is used by `Rule` class to register itself
@@ -142,22 +253,31 @@ def _add(rule: type[Rule], code: int) -> None:  # pyright: ignore [reportUnusedF
 
     # Save state useful in `Rule` methods
     rule.code = code
-    rule._ignore_line = re.compile(  # noqa: SLF001
-        settings.ignore_line.format(
-            name=settings._name(),  # noqa: SLF001
-            code=code,
-        ),
+    name = settings._name()  # noqa: SLF001
+    rule._ignore_line = _compile_ignore(  # noqa: SLF001
+        settings.ignore_line.format(name=name, code=code),
+    )
+    # Code-agnostic prefilter shared by all rules of this linter
+    # (one compilation per name thanks to `_compile_ignore`);
+    # `None` (customized template with content right after `{code}`)
+    # disables the prefilter instead of missing per-code matches
+    rule._ignore_line_any = (  # noqa: SLF001
+        _compile_ignore(settings.ignore_line.format(name=name, code=""))
+        if _supports_any_code(settings.ignore_line)
+        else None
     )
 
     # Saving __instance__ of the rule, __not class__!
     _registry[code] = rule()
+    # Cached queries are stale as of now
+    _cached_query.cache_clear()
 
 
 def _process(
     whole: Iterable[int],
     include: Iterable[int] | None,
     exclude: Iterable[int] | None,
-) -> set[int]:
+) -> collections.abc.Set[int]:
     """Process the query based on include and exclude iterables.
 
     Warning:
@@ -175,6 +295,14 @@ def _process(
         The set of items that match the query.
 
     """
-    return (set(whole) if include is None else set(include)).difference(
-        set(exclude) if exclude else set()
+    # Dict key views already support set operations, hence `whole`
+    # (always `_registry.keys()` in practice) needs no `set` copy
+    # before the difference
+    base: collections.abc.Set[int] = (
+        whole if isinstance(whole, collections.abc.Set) else set(whole)
     )
+    if include is not None:
+        base = set(include)
+    if exclude:
+        return base - set(exclude)
+    return base if isinstance(base, set) else set(base)
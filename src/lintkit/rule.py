@@ -27,10 +27,11 @@ import typing
 if typing.TYPE_CHECKING:
     import pathlib
 
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
     from re import Pattern
 
-    from ._ignore import Span
+    from . import type_definitions
+    from ._ignore import Spans
 
 
 from . import error as e
@@ -51,6 +52,8 @@ class Rule(abc.ABC):
 
     """
 
+    __slots__: tuple[str, ...] = ()  # pyright: ignore[reportIncompatibleUnannotatedOverride]
+
     code: int | None = None
     """Integer code assigned to the rule.
 
@@ -97,7 +100,17 @@ class Rule(abc.ABC):
 
     """
 
-    _lines: list[str] | None = None
+    _ignore_line_any: Pattern[str] | None = None
+    """Code-agnostic variant of `_ignore_line` shared by every rule.
+
+    Note:
+        Compiled once per linter name (with an empty `code`), it
+        cheaply rejects lines without any ignore comment before the
+        per-rule pattern runs (most lines carry no `noqa` at all).
+
+    """
+
+    _lines: Sequence[str] | None = None
     """Content split by lines. Used in multiple places, hence cached.
 
     Info:
@@ -105,7 +118,7 @@ class Rule(abc.ABC):
 
     """
 
-    _ignore_spans: list[Span] | None = None
+    _ignore_spans: Spans | None = None
     """Text spans where the rules should be ignored.
 
     Info:
@@ -113,6 +126,47 @@ class Rule(abc.ABC):
 
     """
 
+    _line_cache: dict[int, bool] | None = None
+    """Per-file memo of the line-ignore regex verdict by line number.
+
+    Note:
+        Several `Value`s frequently share a line (e.g. multiple AST
+        nodes of one statement); the regex runs once per line instead
+        of once per value.
+
+    Info:
+        Will be populated by [`lintkit.loader`][], initially `None`.
+
+    """
+
+    _has_ignores: bool = False
+    """Whether the current file can ignore values at all.
+
+    Note:
+        `False` (no spans and no ignore-comment mention anywhere in
+        the content) lets rules skip `ignored()` per value entirely.
+
+    Info:
+        Will be populated by [`lintkit.loader`][], initially `False`.
+
+    """
+
+    _printer: type_definitions.Output | None = None
+    """Output function resolved once per file instead of per error.
+
+    Info:
+        Will be populated by [`lintkit.loader`][], initially `None`.
+
+    """
+
+    _linter_name: str | None = None
+    """Linter name resolved once per file instead of per error.
+
+    Info:
+        Will be populated by [`lintkit.loader`][], initially `None`.
+
+    """
+
     @abc.abstractmethod
     def values(self) -> Iterable[Value[typing.Any]]:
         """Function returning values to check against.
@@ -236,10 +290,9 @@ class Rule(abc.ABC):
         if self.code is None:
             raise e.CodeMissingError(self)
 
-    # Refactoring this method might break pyright
-    # (e.g. verifying attributes are set will not be picked up
-    # if done in a separate helper method).
-    def ignored(self, value: Value[T]) -> bool:  # noqa: C901
+    # Verifying attributes are set must stay within this method
+    # (pyright will not pick the check up from a separate helper).
+    def ignored(self, value: Value[T]) -> bool:
         """Check if the value should be ignored by this `rule`.
 
         Info:
@@ -265,38 +318,53 @@ class Rule(abc.ABC):
             for whatever reason.
 
         """
+        # Bound to locals once: this method runs per-`Value` and
+        # repeated `self.` lookups walk the MRO each time (also lets
+        # pyright narrow `None` away for the whole body).
+        ignore_line = self._ignore_line
+        ignore_line_any = self._ignore_line_any
+        ignore_spans = self._ignore_spans
+        lines = self._lines
+        line_cache = self._line_cache
+
         # Branch below should never run (all necessary attributes)
         # would be instantiated before this call.
         # - Cannot use `any` due to pyright not understanding this check
-        # - Cannot refactor as `pyright` will not catch it
+        # (`ignore_line_any` is legitimately `None` when the
+        # `settings.ignore_line` shape invalidates the prefilter)
         if (
-            self._ignore_line is None
-            or self._ignore_spans is None
-            or self._lines is None
+            ignore_line is None
+            or ignore_spans is None
+            or lines is None
+            or line_cache is None
         ):  # pragma: no cover
             raise e.LintkitInternalError
 
-        pointer = value._self_start_line  # noqa: SLF001
-        if not pointer:
+        # Single branch for the common (line-backed) case;
+        # the line number is unpacked from the `Pointer` directly
+        start_line = value._self_start_line.value  # noqa: SLF001
+        if start_line is None:
+            # No line number available (e.g. JSON or a `Value`
+            # created directly); fall back to the comment, if any
             if value._self_comment is None:  # noqa: SLF001
                 return False
             # Currently used for TOML comments
             # Some additional tests might be necessary
-            return self._ignore_line.search(value._self_comment) is not None  # noqa: SLF001  # pragma: no cover
-
-        start_line = pointer.value
-        if start_line is not None:
-            for span in self._ignore_spans:
-                if start_line in span:
-                    return True
-            return (
-                self._ignore_line.search(self._lines[start_line - 1])
-                is not None
-            )
-
-        # This might happen when there is no comment, nor line number available
-        # An example would be JSON and `Value` created directly
-        return False  # pragma: no cover
+            return ignore_line.search(value._self_comment) is not None  # noqa: SLF001  # pragma: no cover
+
+        if start_line in ignore_spans:
+            return True
+        result = line_cache.get(start_line)
+        if result is None:
+            line = lines[start_line - 1]
+            # Shared prefilter: skip the per-rule pattern on lines
+            # without any ignore comment (the vast majority)
+            result = (
+                ignore_line_any is None
+                or ignore_line_any.search(line) is not None
+            ) and ignore_line.search(line) is not None
+            line_cache[start_line] = result
+        return result
 
     def error(
         self,
@@ -328,19 +396,28 @@ class Rule(abc.ABC):
         Returns:
             bool: Always True as the error was raised
         """
-        printer = settings._output()  # noqa: SLF001
-
+        # Resolved per-file by the loader; the fallback covers calls
+        # outside the per-file window (e.g. `All` rules finalizing
+        # after the run-wide reset)
+        printer = self._printer
+        if printer is None:
+            printer = settings._output()  # noqa: SLF001
+        name = self._linter_name
+        if name is None:
+            name = settings._name()  # noqa: SLF001
+
+        start_line, start_column, end_line, end_column = value._self_positions()  # noqa: SLF001
         printer(
             # This might be error prone for multiple linters defined
             # as the same package.
-            name=settings._name(),  # noqa: SLF001 # pyright: ignore[reportCallIssue]
+            name=name,  # pyright: ignore[reportCallIssue]
             code=self.code,
             message=message,
             file=self.file,
-            start_line=value._self_start_line,  # noqa: SLF001
-            start_column=value._self_start_column,  # noqa: SLF001
-            end_line=value._self_end_line,  # noqa: SLF001
-            end_column=value._self_end_column,  # noqa: SLF001
+            start_line=start_line,
+            start_column=start_column,
+            end_line=end_line,
+            end_column=end_column,
         )
         return True
 
@@ -366,6 +443,23 @@ class Rule(abc.ABC):
         """
         raise NotImplementedError
 
+    def _call_list(self) -> list[bool]:
+        """Eagerly run this `rule` and return all results.
+
+        Note:
+            Used by the runner when every value will be consumed
+            anyway (`end_mode="all"`); concrete subclasses may
+            override it with a tighter loop than the generator
+            `__call__` (which stays the source of truth for the
+            lazily consumed `end_mode="first"` path).
+
+        Returns:
+            One entry per checked value, `True` when it violated
+                the rule.
+
+        """
+        return list(self())
+
 
 class Node(Rule, abc.ABC):
     """Rule that is applied on a node (e.g. Python `dict` in a parsed program).
@@ -376,6 +470,8 @@ class Node(Rule, abc.ABC):
 
     """
 
+    __slots__: tuple[str, ...] = ()  # pyright: ignore[reportIncompatibleUnannotatedOverride]
+
     @abc.abstractmethod
     def message(self, value: Value[typing.Any]) -> str:
         """Message to output when the rule is violated.
@@ -415,8 +511,9 @@ class Node(Rule, abc.ABC):
             `True` if a given node violates the rule, `False` otherwise.
 
         """
+        has_ignores = self._has_ignores
         for value in self.values():
-            if self.ignored(value):
+            if has_ignores and self.ignored(value):
                 yield False
             else:
                 error = self.check(value)
@@ -425,6 +522,31 @@ class Node(Rule, abc.ABC):
                 else:
                     yield self.error(self.message(value), value)
 
+    def _call_list(self) -> list[bool]:  # pyright: ignore[reportImplicitOverride]
+        """Eagerly run this `rule` and return all results.
+
+        Note:
+            Mirrors `__call__` with bound methods hoisted to locals;
+            per-value generator resumption and repeated attribute
+            lookups add up on files with thousands of nodes.
+
+        Returns:
+            One entry per checked value, `True` when it violated
+                the rule.
+
+        """
+        results: list[bool] = []
+        append = results.append
+        has_ignores = self._has_ignores
+        ignored = self.ignored
+        check = self.check
+        for value in self.values():
+            if (has_ignores and ignored(value)) or not check(value):
+                append(False)
+            else:
+                append(self.error(self.message(value), value))
+        return results
+
 
 class _NotNode(Rule, abc.ABC):
     """Base class for rules that are not applied on a node.
@@ -434,6 +556,8 @@ class _NotNode(Rule, abc.ABC):
         implementations of this class.
     """
 
+    __slots__: tuple[str, ...] = ("n_fails",)  # pyright: ignore[reportIncompatibleUnannotatedOverride]
+
     @abc.abstractmethod
     def message(self) -> str:
         """Message to output when the rule is violated.
@@ -518,9 +642,10 @@ class _NotNode(Rule, abc.ABC):
             interface compatible with [`lintkit.rule.Node`][]
 
         """
+        has_ignores = self._has_ignores
         for value in self.values():
             # This line is checked, implicit else is not
-            if not self.ignored(value):  # pragma: no branch
+            if not (has_ignores and self.ignored(value)):  # pragma: no branch
                 fail = self.check(value)
                 if fail:
                     self.n_fails += 1
@@ -571,6 +696,8 @@ class File(_NotNode, abc.ABC):
         decide what to do with accumulated errors.
     """
 
+    __slots__: tuple[str, ...] = ()  # pyright: ignore[reportIncompatibleUnannotatedOverride]
+
 
 class All(_NotNode, abc.ABC):
     """Rule that is applied __on a all files__.
@@ -591,3 +718,5 @@ class All(_NotNode, abc.ABC):
         [`lintkit.rule.File.finalize`][] is effectively a place where you
         decide what to do with accumulated errors.
     """
+
+    __slots__: tuple[str, ...] = ()  # pyright: ignore[reportIncompatibleUnannotatedOverride]
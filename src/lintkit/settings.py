@@ -79,6 +79,8 @@ Example:
 
 from __future__ import annotations
 
+import os
+import pathlib
 import typing
 
 if typing.TYPE_CHECKING:
@@ -113,6 +115,29 @@ Tip:
 
 """
 
+disk_cache: bool = False
+"""Whether to persist parsed file artifacts across linter runs.
+
+When enabled, parsed representations (Python `ast`, `JSON`/`TOML`
+data) are pickled under [`lintkit.settings.disk_cache_dir`][] keyed
+by a hash of the file content, so repeated runs over an unchanged
+project (pre-commit, editor integrations) skip parsing entirely.
+
+Warning:
+    The cache directory is trusted: entries are loaded with
+    [`pickle`](https://docs.python.org/3/library/pickle.html),
+    __do not point it at a location other users can write to__.
+
+"""
+
+disk_cache_dir: pathlib.Path = (
+    pathlib.Path(
+        os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache")
+    )
+    / "lintkit"
+)
+"""Directory storing the [`lintkit.settings.disk_cache`][] entries."""
+
 ignore_line: str = ".* noqa: .*{name}{code}.*"
 """The regex pattern registering a line to be ignored.
 
@@ -120,6 +145,13 @@ Note:
     By default will match any line containing ` noqa: {name}{code}`,
     possibly with multiple errors on the same line, e.g.
     ```# noqa: E123, E456``` or ```# noqa: E123 E456 E789```.
+
+Warning:
+    Lines are prefiltered with the pattern rendered with an __empty__
+    `code`, which is only correct when `{code}` is followed by
+    nothing or a `.*`-prefixed piece (as in the default). Other
+    shapes (e.g. a literal right after `{code}`) are detected and
+    fall back to matching every line per-rule.
 """
 
 ignore_file: str = ".* noqa-file: [^\n]*{name}{code}.*[^\n]*"
@@ -138,6 +170,10 @@ Warning:
     User has to provide `ignore_span_end` otherwise an error will
     be raised.
 
+Warning:
+    Shares the empty-`code` prefilter requirement described for
+    [`lintkit.settings.ignore_line`][].
+
 Note:
     By default will match any line containing `# noqa-start: {name}{code}`,
     possibly with multiple errors on the same line, e.g.
@@ -151,6 +187,10 @@ Warning:
     User has to provide `ignore_span_start`, otherwise this
     `noqa` will have no effect.
 
+Warning:
+    Shares the empty-`code` prefilter requirement described for
+    [`lintkit.settings.ignore_line`][].
+
 Note:
     By default will match any line containing `# noqa-end: {name}{code}`,
     possibly with multiple errors on the same line, e.g.
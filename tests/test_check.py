@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Test `lintkit.check` building blocks directly."""
+
+from __future__ import annotations
+
+import typing
+
+import pytest
+
+import lintkit
+
+
+class _ContainsAB(lintkit.check.Contains):
+    """Check for a nested `value["a"]["b"]` entry."""
+
+    def keys(self) -> tuple[str, ...]:  # pyright: ignore[reportImplicitOverride]
+        """Keys to check for.
+
+        Returns:
+            Tuple of keys to check.
+
+        """
+        return ("a", "b")
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    (
+        ({"a": {"b": 1}}, True),
+        ({"a": {"c": 1}}, False),
+        # Intermediate value is not a mapping, hence no `["b"]` lookup
+        ({"a": 1}, False),
+    ),
+)
+def test_contains(data: dict[str, typing.Any], expected: bool) -> None:  # noqa: FBT001
+    """Check `Contains` against nested (and non-mapping) values.
+
+    Args:
+        data: Data wrapped in a `Value` and checked.
+        expected: Whether the check should succeed.
+
+    """
+    assert _ContainsAB().check(lintkit.Value.from_json(data)) is expected
@@ -7,10 +7,13 @@
 
 from __future__ import annotations
 
+import ast
 import typing
 
+import pytest
+
 if typing.TYPE_CHECKING:
-    import pytest
+    import pathlib
 
 import lintkit
 
@@ -36,6 +39,71 @@ def test_config(request: pytest.FixtureRequest) -> None:
             assert 200 < rule.code < 300  # noqa: PLR2004  # nosemgrep: B101
 
 
+def test_toml_fast(request: pytest.FixtureRequest) -> None:
+    """Run TOML rules with the stdlib `tomllib` parser.
+
+    Same expectations as `test_config`, except `data` is parsed
+    into plain Python objects instead of `tomlkit.Items`.
+
+    Args:
+        request: Fixture request to get the path of the test file.
+
+    """
+    lintkit.loader.TOML.round_trip = False
+    try:
+        for fail, rule in lintkit.run(  # pyright: ignore[reportGeneralTypeIssues]
+            (request.path.parent / "data").glob("*.toml"),
+            output=True,
+        ):
+            if fail:
+                # Bandit false positive
+                assert 200 < rule.code < 300  # noqa: PLR2004  # nosemgrep: B101
+    finally:
+        lintkit.loader.TOML.round_trip = True
+
+
+@pytest.mark.parametrize(
+    ("parser", "content"),
+    (
+        ("_parse_json", '{"this": {"test": "is a test"}}'),
+        ("_parse_python", "this = 'is a test'\n"),
+        ("_parse_toml", 'this = "is a test"\n'),
+    ),
+)
+def test_disk_cache(
+    parser: str,
+    content: str,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Parse identical content twice through the on-disk cache.
+
+    The second parse (after dropping the in-memory memo) must be
+    served from the cache directory and agree with the first.
+
+    Args:
+        parser: Name of the content-keyed parser to exercise.
+        content: Content (matching `parser`) to parse twice.
+        monkeypatch: Fixture to toggle the cache settings.
+        tmp_path: Temporary cache directory.
+
+    """
+    monkeypatch.setattr(lintkit.settings, "disk_cache", True)
+    monkeypatch.setattr(lintkit.settings, "disk_cache_dir", tmp_path)
+
+    parse = getattr(lintkit.loader, parser)
+    first = parse(content)
+    # Drop the in-memory memo so the second call goes to disk
+    parse.cache_clear()
+    second = parse(content)
+
+    if isinstance(first, ast.AST):
+        # `ast` nodes do not define structural equality
+        first, second = ast.dump(first), ast.dump(second)
+    assert first == second  # nosemgrep: B101
+    assert list(tmp_path.iterdir())  # nosemgrep: B101
+
+
 def test_file_loader(request: pytest.FixtureRequest) -> None:
     """Run all registered rules on a file loader.
 
@@ -19,9 +19,14 @@ Warning:
 
 from __future__ import annotations
 
+import ast
 import typing
 
 if typing.TYPE_CHECKING:
+    import pathlib
+
+    from collections.abc import Iterable
+
     import pytest
 
 import lintkit
@@ -43,6 +48,11 @@ def miss3() -> None:
     """Dummy function."""
 
 
+# Marker of an unregistered code inside the span; candidate for the
+# shared scan, yet it must not end the TEST0-TEST2 span above
+# noqa-end: TEST9
+
+
 # noqa-end: TEST2, TEST1, TEST0
 
 
@@ -63,3 +73,91 @@ def test_noqa(
     for fail, _ in lintkit.run([request.path], output=True):  # pyright: ignore[reportGeneralTypeIssues]
         # Bandit false positive
         assert not fail  # nosemgrep: B101
+
+
+def test_custom_templates(tmp_path: pathlib.Path) -> None:
+    """Run a rule registered under prefilter-unfriendly templates.
+
+    A literal right after `{code}` invalidates the shared any-code
+    prefilters (the empty-`code` render no longer matches a superset
+    of the per-code renders), hence both the per-line and the span
+    ignores have to take the scan-everything fallbacks.
+
+    """
+    originals = (
+        lintkit.settings.ignore_line,
+        lintkit.settings.ignore_span_start,
+        lintkit.settings.ignore_span_end,
+    )
+    try:
+        lintkit.settings.ignore_line = ".* skip: .*{name}{code} -->.*"
+        lintkit.settings.ignore_span_start = (
+            ".* skip-start: .*{name}{code} -->.*"
+        )
+        lintkit.settings.ignore_span_end = ".* skip-end: .*{name}{code} -->.*"
+
+        class CustomNoqa(lintkit.loader.Python, lintkit.rule.Node, code=401):
+            """Rule matching every `miss*` name in the source."""
+
+            def message(  # pyright: ignore[reportImplicitOverride]
+                self, _: lintkit.Value[typing.Any] | None = None
+            ) -> str:
+                """Return an empty message.
+
+                Args:
+                    _: Value to process (not used in this case).
+
+                Returns:
+                    An empty string as the message.
+
+                """
+                return ""
+
+            def values(self) -> Iterable[lintkit.Value[str]]:
+                """Yield every `ast.Name` identifier.
+
+                Yields:
+                    `Value` representation of the name.
+
+                """
+                for node in self.getitem("nodes_map")[ast.Name]:
+                    yield lintkit.Value.from_python(node.id, node)
+
+            def check(  # pyright: ignore[reportImplicitOverride]
+                self, value: lintkit.Value[str]
+            ) -> bool:
+                """Check whether the name starts with `miss`.
+
+                Args:
+                    value: Name to check.
+
+                Returns:
+                    `True` if the name starts with `miss`.
+
+                """
+                return str(value).startswith("miss")
+
+        file = tmp_path / "sample.py"
+        file.write_text(
+            "# skip-start: TEST401 -->\n"
+            "miss_c = 1\n"
+            "# skip-end: TEST401 -->\n"
+            # Two names on one line share the per-line ignore lookup
+            "miss_a = miss_b  # skip: TEST401 -->\n"
+            "miss_d = 1  # skip: TEST401\n"
+        )
+        fails = [
+            rule.code
+            for fail, rule in lintkit.run([file], output=True)  # pyright: ignore[reportGeneralTypeIssues]
+            if fail
+        ]
+        # Only the marker missing the ` -->` literal does not ignore
+        assert fails == [401]  # nosemgrep: B101
+    finally:
+        (
+            lintkit.settings.ignore_line,
+            lintkit.settings.ignore_span_start,
+            lintkit.settings.ignore_span_end,
+        ) = originals
+        lintkit.registry._registry.pop(401)  # noqa: SLF001
+        lintkit.registry._cached_query.cache_clear()  # noqa: SLF001
@@ -44,13 +44,15 @@ def test_not_node(
         "this": {"test": 1},
     }
 
-    fails = collections.defaultdict(int)
-
-    for fail, rule in lintkit.run(  # pyright: ignore[reportGeneralTypeIssues]
-        [request.path] * n_files, output=True, end_mode=end_mode
-    ):
-        if fail:
-            fails[rule.code] += 1
+    # `Counter` aggregates the codes in one C-level pass
+    # (and, like `defaultdict(int)`, returns `0` for absent codes)
+    fails = collections.Counter(
+        rule.code
+        for fail, rule in lintkit.run(  # pyright: ignore[reportGeneralTypeIssues]
+            [request.path] * n_files, output=True, end_mode=end_mode
+        )
+        if fail
+    )
 
     if end_mode == "first":
         # Single fail of `File rule
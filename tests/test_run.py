@@ -11,6 +11,9 @@ import typing
 
 import pytest
 
+if typing.TYPE_CHECKING:
+    import pathlib
+
 import lintkit
 
 
@@ -71,6 +74,111 @@ def test_run_output_smoke(
     _ = lintkit.run([request.path])
 
 
+# Not named `test_run*` on purpose (it would match the rule regex)
+def test_lazy_lines() -> None:
+    r"""Test the lazy line view used by `lintkit.run` internally.
+
+    Note:
+        Content has to be split on `"\\n"` __only__; `splitlines`
+        would also split on form feeds, desynchronizing line
+        numbers from `ast` and the `noqa` span scan.
+
+    """
+    lines = lintkit._run._LazyLines("a\fb\nc\n")  # noqa: SLF001
+
+    assert len(lines) == 3  # noqa: PLR2004
+    assert list(lines) == ["a\fb", "c", ""]
+    assert lines[0] == "a\fb"
+
+
+# Not named `test_run*` on purpose (it would match the rule regex)
+def test_crlf_read(tmp_path: pathlib.Path) -> None:
+    r"""Test that CRLF (and CR) files read like text mode.
+
+    Note:
+        Files are read in binary mode; without the manual newline
+        translation every line of a CRLF file would carry a
+        trailing `\r`.
+
+    """
+    file = tmp_path / "sample.py"
+    file.write_bytes(b"x = 1\r\ny = 2\rz = 3\n")
+
+    lines, content = lintkit._run._read(file)  # noqa: SLF001
+
+    assert content == "x = 1\ny = 2\nz = 3\n"
+    assert list(lines) == ["x = 1", "y = 2", "z = 3", ""]
+
+
+# Not named `test_run*` on purpose (it would match the rule regex)
+@pytest.mark.parametrize("jobs", (0, 2))
+def test_jobs_parallel(
+    jobs: int,
+    request: pytest.FixtureRequest,
+) -> None:
+    """Test the process-pool path against the sequential run.
+
+    Note:
+        Two files force the pool (a single file falls back to the
+        sequential path); `jobs=0` additionally exercises the
+        all-CPUs default. `test_not_node.py` makes the `All` rule
+        fail, hence the worker-side `n_fails` deltas are merged.
+
+    Args:
+        jobs:
+            Number of worker processes to use in the run.
+        request:
+            Pytest fixture request object
+            (used to get the path to the test file).
+
+    """
+    files = [request.path, request.path.parent / "test_not_node.py"]
+    reference = sorted(
+        (fail, rule.code)
+        for fail, rule in lintkit.run(files, output=True, jobs=1)  # pyright: ignore[reportGeneralTypeIssues]
+    )
+
+    parallel = sorted(
+        (fail, rule.code)
+        for fail, rule in lintkit.run(files, output=True, jobs=jobs)  # pyright: ignore[reportGeneralTypeIssues]
+    )
+
+    assert parallel == reference  # nosemgrep: B101
+
+
+# Not named `test_run*` on purpose (it would match the rule regex)
+@pytest.mark.parametrize("jobs", (1, 2))
+def test_jobs(
+    jobs: int,
+    request: pytest.FixtureRequest,
+) -> None:
+    """Test that run function gives the same results for any `jobs`.
+
+    Note:
+        A single file is linted, hence `jobs=2` exercises the
+        sequential fallback (there is nothing to parallelize).
+
+    Args:
+        jobs:
+            Number of worker processes to use in the run.
+        request:
+            Pytest fixture request object
+            (used to get the path to the test file).
+
+    """
+    fails_counter = 0
+    for fail, rule in lintkit.run(  # pyright: ignore[reportGeneralTypeIssues]
+        [request.path],
+        output=True,
+        jobs=jobs,
+    ):
+        if fail and rule.code == 0:
+            fails_counter += 1
+
+    # As many fails as `test_run*` functions in this file
+    assert fails_counter == 3  # noqa: PLR2004
+
+
 @pytest.mark.parametrize("end_mode", ("first", "all"))
 def test_run_mode(
     end_mode: typing.Literal["first", "all"],
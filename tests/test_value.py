@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Test the `lintkit.Value` proxy behaves like the wrapped object."""
+
+from __future__ import annotations
+
+import lintkit
+
+
+def test_value_scalar() -> None:
+    """Check scalar-like dunders forward to the wrapped value."""
+    value = lintkit.Value.from_json(21)
+
+    assert str(value) == "21"
+    assert bool(value)
+    assert value == lintkit.Value.from_json(21)
+    assert value != 42  # noqa: PLR2004
+    assert value + 1 == 22  # noqa: PLR2004
+    assert value + lintkit.Value.from_json(1) == 22  # noqa: PLR2004
+    assert hex(value) == "0x15"
+
+
+def test_value_arithmetic() -> None:
+    """Check arithmetic dunders against plain and wrapped values."""
+    value = lintkit.Value.from_json(21)
+
+    assert value - 1 == 20  # noqa: PLR2004
+    assert value * 2 == 42  # noqa: PLR2004
+    assert value / 2 == 10.5  # noqa: PLR2004
+    assert value // 2 == 10  # noqa: PLR2004
+    assert value % 2 == 1
+    assert value**2 == 441  # noqa: PLR2004
+    assert value - lintkit.Value.from_json(1) == 20  # noqa: PLR2004
+    assert value * lintkit.Value.from_json(2) == 42  # noqa: PLR2004
+    assert value / lintkit.Value.from_json(2) == 10.5  # noqa: PLR2004
+    assert value // lintkit.Value.from_json(2) == 10  # noqa: PLR2004
+    assert value % lintkit.Value.from_json(2) == 1
+    assert value ** lintkit.Value.from_json(2) == 441  # noqa: PLR2004
+    assert -value == -21  # noqa: PLR2004
+    assert abs(lintkit.Value.from_json(-21)) == 21  # noqa: PLR2004
+    assert int(value) == 21  # noqa: PLR2004
+    assert float(value) == 21.0  # noqa: PLR2004
+
+
+def test_value_ordering() -> None:
+    """Check ordering comparisons against plain and wrapped values."""
+    value = lintkit.Value.from_json(21)
+
+    assert value < 42  # noqa: PLR2004
+    assert value <= 21  # noqa: PLR2004
+    assert value > 0
+    assert value >= 21  # noqa: PLR2004
+    assert value < lintkit.Value.from_json(42)
+    assert value <= lintkit.Value.from_json(21)
+    assert value > lintkit.Value.from_json(0)
+    assert value >= lintkit.Value.from_json(21)
+
+
+def test_value_container() -> None:
+    """Check container-like dunders forward to the wrapped value."""
+    value = lintkit.Value.from_json({"a": 1, "b": 2})
+
+    assert len(value) == 2  # noqa: PLR2004
+    assert "a" in value
+    assert value["b"] == 2  # noqa: PLR2004
+    assert list(value) == ["a", "b"]
+    assert next(lintkit.Value.from_json(iter("ab"))) == "a"
+
+
+def test_pointer_bool() -> None:
+    """Check `Pointer` truthiness means "has a value"."""
+    assert lintkit._value.Pointer(1)  # noqa: SLF001
+    assert not lintkit._value.Pointer()  # noqa: SLF001